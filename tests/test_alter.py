@@ -30,6 +30,12 @@ def test_alter_table_rename_column(tmp_path):
         assert db.execute("ALTER TABLE users RENAME COLUMN name TO full_name") == "OK"
         rows = db.execute("SELECT full_name FROM users WHERE id = 1")
         assert rows == [{"full_name": "Alice"}]
+
+        try:
+            db.execute("SELECT name FROM users")
+            assert False, "Expected the old column name to be unknown"
+        except (KeyError, ValueError) as exc:
+            assert "name" in str(exc)
     finally:
         db.close()
 
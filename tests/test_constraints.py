@@ -171,6 +171,26 @@ def test_default_value_on_create_and_alter_add_column(tmp_path):
         db.close()
 
 
+def test_wide_and_non_ascii_defaults_survive_reopen(tmp_path):
+    path = str(tmp_path / "defaults_reopen.db")
+    db = TinyDB(path)
+    try:
+        db.execute(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, "
+            "big INTEGER DEFAULT 1180591620717411303424, label TEXT DEFAULT 'h\u00e9llo')"
+        )
+    finally:
+        db.close()
+
+    db = TinyDB(path)
+    try:
+        db.execute("INSERT INTO items (id) VALUES (1)")
+        rows = db.execute("SELECT big, label FROM items WHERE id = 1")
+        assert rows == [{"big": 1180591620717411303424, "label": "h\u00e9llo"}]
+    finally:
+        db.close()
+
+
 def test_foreign_key_references_enforced_on_insert(tmp_path):
     db = TinyDB(str(tmp_path / "fk_insert.db"))
     try:
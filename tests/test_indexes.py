@@ -1,3 +1,5 @@
+import json
+import struct
 import sys
 from pathlib import Path
 
@@ -8,6 +10,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from tinydb_engine import TinyDB
+from tinydb_engine.index.btree import BTreeIndex
 
 
 def test_create_index_on_unique_column_and_select(tmp_path):
@@ -111,3 +114,104 @@ def test_show_drop_index_and_explain(tmp_path):
         assert rows == []
     finally:
         db.close()
+
+
+def test_btree_nodes_round_trip_text_and_composite_keys(tmp_path):
+    db = TinyDB(str(tmp_path / "index_binary_nodes.db"))
+    try:
+        db.execute("CREATE TABLE users (email TEXT PRIMARY KEY, name TEXT, region TEXT)")
+        for i in range(60):
+            db.execute(f"INSERT INTO users VALUES ('user{i:03d}@example.com', 'name{i % 7}', 'r{i % 3}')")
+        db.execute("CREATE INDEX idx_users_name_region ON users(name, region)")
+
+        rows = db.execute("SELECT name FROM users WHERE email = 'user042@example.com'")
+        assert rows == [{"name": "name0"}]
+
+        rows = db.execute("SELECT email FROM users WHERE name = 'name3' AND region = 'r1' ORDER BY email ASC")
+        assert rows == [{"email": f"user{i:03d}@example.com"} for i in range(60) if i % 7 == 3 and i % 3 == 1]
+    finally:
+        db.close()
+
+
+def test_btree_reads_legacy_json_nodes(tmp_path):
+    db = TinyDB(str(tmp_path / "index_legacy_nodes.db"))
+    try:
+        db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        schema = db.executor.schemas["users"]
+        root_page = int(schema.pk_index_root_page)
+        location = BTreeIndex(db.pager, root_page).find(1)
+        payload = json.dumps(
+            {"is_leaf": True, "keys": [1], "children": [], "values": [list(location)]},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        page = bytearray(db.pager.page_size)
+        page[:4] = struct.pack("<I", len(payload))
+        page[4 : 4 + len(payload)] = payload
+        db.pager.write_page(root_page, bytes(page))
+
+        assert db.execute("SELECT name FROM users WHERE id = 1") == [{"name": "Alice"}]
+        assert db.execute("INSERT INTO users VALUES (2, 'Bob')") == "OK"
+        assert db.execute("SELECT name FROM users WHERE id = 2") == [{"name": "Bob"}]
+    finally:
+        db.close()
+
+
+def test_primary_key_lookup_finds_keys_promoted_by_splits(tmp_path):
+    db = TinyDB(str(tmp_path / "index_split_separators.db"))
+    try:
+        db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+        for i in range(600):
+            db.execute(f"INSERT INTO items VALUES ({i}, 'item{i}')")
+
+        missing = [i for i in range(600) if not db.execute(f"SELECT id FROM items WHERE id = {i}")]
+        assert missing == []
+        for i in range(0, 600, 50):
+            with pytest.raises(ValueError, match="Duplicate primary key"):
+                db.execute(f"INSERT INTO items VALUES ({i}, 'again')")
+    finally:
+        db.close()
+
+
+def test_create_index_and_reindex_bulk_load_many_rows(tmp_path):
+    db = TinyDB(str(tmp_path / "index_bulk_load.db"))
+    try:
+        db.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, label TEXT)")
+        for start in range(0, 600, 100):
+            values = ", ".join(f"({i}, 'group{(i * 7) % 40:02d}')" for i in range(start, start + 100))
+            db.execute(f"INSERT INTO items VALUES {values}")
+
+        assert db.execute("CREATE INDEX idx_items_label ON items(label)") == "OK"
+        assert db.execute("REINDEX items") == "OK"
+
+        expected = [{"id": i} for i in range(600) if (i * 7) % 40 == 13]
+        assert db.execute("SELECT id FROM items WHERE label = 'group13' ORDER BY id ASC") == expected
+        assert db.execute("SELECT label FROM items WHERE id = 599") == [{"label": "group33"}]
+
+        pager = db.pager
+        btree = BTreeIndex.create(pager)
+        with pytest.raises(ValueError, match="Duplicate primary key"):
+            btree.insert_many([(5, (1, 0)), (3, (1, 1)), (5, (1, 2))])
+    finally:
+        db.close()
+
+
+def test_btree_lookups_return_location_tuples(tmp_path):
+    db = TinyDB(str(tmp_path / "index_location_tuples.db"))
+    try:
+        unique = BTreeIndex.create(db.pager)
+        unique.insert(7, [3, 1])
+        postings = BTreeIndex.create(db.pager)
+        postings.insert_non_unique("a", [4, 0])
+        postings.insert_non_unique("a", (4, 1))
+
+        for btree in (unique, BTreeIndex(db.pager, unique.root_page_id)):
+            assert type(btree.find(7)) is tuple
+            assert btree.find(7) == (3, 1)
+            assert btree.scan_items() == [(7, (3, 1))]
+        for btree in (postings, BTreeIndex(db.pager, postings.root_page_id)):
+            assert btree.find_all("a") == [(4, 0), (4, 1)]
+            assert all(type(loc) is tuple for loc in btree.find_all("a"))
+    finally:
+        db.close()
@@ -120,3 +120,22 @@ def test_describe_table_includes_index_metadata(tmp_path):
         assert region_row["default"] == "NA"
     finally:
         db.close()
+
+
+def test_show_tables_after_reopen_with_spilled_metadata(tmp_path):
+    path = str(tmp_path / "spilled_metadata.db")
+    names = [f"table_number_{i:02d}" for i in range(30)]
+    db = TinyDB(path)
+    try:
+        for name in names:
+            db.execute(f"CREATE TABLE {name} (id INTEGER PRIMARY KEY, name TEXT, email TEXT UNIQUE)")
+        db.execute("INSERT INTO table_number_07 VALUES (1, 'Alice', 'a@example.com')")
+    finally:
+        db.close()
+
+    db = TinyDB(path)
+    try:
+        assert sorted(row["table_name"] for row in db.execute("SHOW TABLES")) == names
+        assert db.execute("SELECT name FROM table_number_07 WHERE id = 1") == [{"name": "Alice"}]
+    finally:
+        db.close()
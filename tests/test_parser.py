@@ -7,7 +7,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from tinydb_engine.parser import ParseError, parse
+from tinydb_engine.parser import ParseError, parse, tokenize
 
 
 def test_parse_select_distinct():
@@ -157,3 +157,23 @@ def test_parse_where_between_predicate():
     stmt = parse("SELECT id FROM users WHERE id BETWEEN 1 AND 3")
     assert stmt.where is not None
     assert stmt.where.groups == [[("id", "BETWEEN", (1, 3))]]
+
+
+def test_tokenize_scans_literals_and_operators():
+    tokens = tokenize("SELECT a.b, 'it''s' FROM t WHERE x>=-1.5 AND y != 2 AND z=>3;")
+    assert tokens == [
+        "SELECT", "a", ".", "b", ",", "'it''s'", "FROM", "t", "WHERE",
+        "x", ">=", "-1.5", "AND", "y", "!=", "2", "AND", "z", "=>", "3",
+    ]
+    assert tokenize("x - 1.") == ["x", "-", "1", "."]
+    with pytest.raises(ParseError, match=r"line 2, col 3 near: '! b'"):
+        tokenize("a\n  ! b")
+
+
+def test_parse_reuses_ast_for_repeated_statements():
+    sql = "SELECT id FROM users WHERE name = 'Alice'"
+    assert parse(sql) is parse(sql)
+    assert parse(sql) is not parse(sql.replace("Alice", "Bob"))
+    cached = parse(sql)
+    parse.cache_clear()
+    assert parse(sql) is not cached
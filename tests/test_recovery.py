@@ -1,3 +1,5 @@
+import base64
+import json
 import sys
 from pathlib import Path
 
@@ -34,3 +36,174 @@ def test_recovery_replays_only_committed_writes(tmp_path):
         assert recovered.read_page(page_id) == committed_image
     finally:
         recovered.close()
+
+
+def test_commit_logs_only_the_final_image_of_each_page(tmp_path):
+    db_path = tmp_path / "recovery_coalesce.db"
+
+    pager = Pager(str(db_path), wal=WAL(str(db_path)))
+    page_id = pager.allocate_page()
+    pager.begin()
+    pager.write_page(page_id, bytes([1]) * PAGE_SIZE)
+    pager.write_page(page_id, bytes([2]) * PAGE_SIZE)
+    pager.commit()
+    pager.close()
+
+    replay = WAL(str(db_path)).recover()
+    writes = [write for writes in replay.values() for write in writes if write.page_id == page_id]
+    assert [write.after_image for write in writes] == [bytes([2]) * PAGE_SIZE]
+
+
+def test_recovery_reads_legacy_json_log_and_stops_at_torn_frame(tmp_path):
+    db_path = tmp_path / "recovery_formats.db"
+
+    pager = Pager(str(db_path), wal=WAL(str(db_path)))
+    first_page = pager.allocate_page()
+    second_page = pager.allocate_page()
+    pager.close()
+
+    legacy_image = bytes([3]) * PAGE_SIZE
+    legacy_lines = [
+        {"type": "BEGIN", "txn_id": 1},
+        {
+            "type": "PAGE_WRITE",
+            "txn_id": 1,
+            "page_id": first_page,
+            "after_image": base64.b64encode(legacy_image).decode("ascii"),
+        },
+        {"type": "COMMIT", "txn_id": 1},
+    ]
+    with open(f"{db_path}.wal", "w", encoding="utf-8") as handle:
+        for entry in legacy_lines:
+            handle.write(json.dumps(entry) + "\n")
+
+    wal = WAL(str(db_path))
+    wal.recover()
+    wal.begin()
+    wal.log_page_write(second_page, bytes([4]) * PAGE_SIZE)
+    wal.commit()
+    with open(wal.path, "ab") as handle:
+        handle.write(b"\x00\x05\x00")
+
+    replay = WAL(str(db_path)).recover()
+    assert sorted(replay) == [1, 2]
+
+    recovered = Pager(str(db_path), wal=WAL(str(db_path)))
+    try:
+        assert recovered.read_page(first_page) == legacy_image
+        assert recovered.read_page(second_page) == bytes([4]) * PAGE_SIZE
+    finally:
+        recovered.close()
+
+
+def test_wal_buffers_transaction_and_skips_read_only_commits(tmp_path):
+    db_path = tmp_path / "recovery_group_commit.db"
+
+    pager = Pager(str(db_path), wal=WAL(str(db_path)))
+    first_page = pager.allocate_page()
+    second_page = pager.allocate_page()
+    wal_path = pager.wal.path
+
+    pager.begin()
+    pager.write_page(first_page, bytes([5]) * PAGE_SIZE)
+    pager.write_page(second_page, bytes([6]) * PAGE_SIZE)
+    assert not Path(wal_path).exists() or Path(wal_path).stat().st_size == 0
+    pager.commit()
+    logged_size = Path(wal_path).stat().st_size
+    assert logged_size > 2 * PAGE_SIZE
+
+    pager.begin()
+    pager.read_page(first_page)
+    pager.commit()
+    assert Path(wal_path).stat().st_size == logged_size
+    pager.close()
+
+    replay = WAL(str(db_path)).recover()
+    assert [[write.page_id for write in writes] for writes in replay.values()] == [[first_page, second_page]]
+
+
+def test_commit_writes_adjacent_and_scattered_dirty_pages(tmp_path):
+    db_path = tmp_path / "recovery_page_runs.db"
+
+    pager = Pager(str(db_path), wal=WAL(str(db_path)))
+    page_ids = [pager.allocate_page() for _ in range(6)]
+    written = [page_ids[3], page_ids[0], page_ids[1], page_ids[5]]
+    pager.begin()
+    for page_id in written:
+        pager.write_page(page_id, bytes([page_id]) * PAGE_SIZE)
+    pager.commit()
+    pager.close()
+
+    reopened = Pager(str(db_path), wal=WAL(str(db_path)))
+    try:
+        for page_id in page_ids:
+            expected = bytes([page_id]) * PAGE_SIZE if page_id in written else bytes(PAGE_SIZE)
+            assert reopened.read_page(page_id) == expected
+    finally:
+        reopened.close()
+
+
+def test_allocations_in_a_transaction_persist_the_header_once(tmp_path):
+    db_path = tmp_path / "recovery_header_once.db"
+
+    pager = Pager(str(db_path), wal=WAL(str(db_path)))
+    start = pager.page_count()
+    pager.begin()
+    allocated = [pager.allocate_page() for _ in range(5)]
+    assert 0 not in pager._txn_dirty
+    pager.commit()
+    pager.close()
+
+    replay = WAL(str(db_path)).recover()
+    logged = [write.page_id for writes in replay.values() for write in writes]
+    assert logged.count(0) == 1
+    assert sorted(logged) == [0, *allocated]
+
+    reopened = Pager(str(db_path), wal=WAL(str(db_path)))
+    try:
+        assert reopened.page_count() == start + 5
+    finally:
+        reopened.close()
+
+
+def test_page_cache_tracks_commits_and_ignores_rolled_back_writes(tmp_path):
+    db_path = tmp_path / "recovery_page_cache.db"
+
+    pager = Pager(str(db_path), wal=WAL(str(db_path)))
+    try:
+        page_id = pager.allocate_page()
+        assert pager.read_page(page_id) == bytes(PAGE_SIZE)
+
+        pager.begin()
+        pager.write_page(page_id, bytes([1]) * PAGE_SIZE)
+        pager.commit()
+        assert pager.read_page(page_id) == bytes([1]) * PAGE_SIZE
+
+        pager.begin()
+        pager.write_page(page_id, bytes([2]) * PAGE_SIZE)
+        assert pager.read_page(page_id) == bytes([2]) * PAGE_SIZE
+        pager.rollback()
+        assert pager.read_page(page_id) == bytes([1]) * PAGE_SIZE
+    finally:
+        pager.close()
+
+
+def test_recovery_applies_the_last_committed_image_of_each_page(tmp_path):
+    db_path = tmp_path / "recovery_last_image.db"
+
+    pager = Pager(str(db_path), wal=WAL(str(db_path)))
+    page_id = pager.allocate_page()
+    pager.close()
+
+    wal = WAL(str(db_path))
+    for fill in (1, 2, 3):
+        wal.begin()
+        wal.log_page_write(page_id, bytes([fill]) * PAGE_SIZE)
+        wal.commit()
+    wal.close()
+
+    recovered = Pager(str(db_path), wal=WAL(str(db_path)))
+    try:
+        assert recovered.read_page(page_id) == bytes([3]) * PAGE_SIZE
+    finally:
+        recovered.close()
@@ -5,7 +5,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from tinydb_engine import hash_password, verify_password
+from tinydb_engine import hash_password, verify_password, verify_passwords
 
 
 def test_hash_and_verify_password_round_trip():
@@ -25,3 +25,14 @@ def test_verify_password_rejects_invalid_hash_data():
     assert not verify_password("abc123", "")
     assert not verify_password("abc123", "pbkdf2_sha256$notanint$abc$def")
     assert not verify_password("abc123", "unknown$200000$abc$def")
+
+
+def test_verify_passwords_checks_batches_in_order():
+    first = hash_password("alpha-pass", iterations=50_000)
+    second = hash_password("beta-pass", iterations=50_000)
+
+    results = verify_passwords(
+        [("alpha-pass", first), ("wrong", second), ("beta-pass", second), ("alpha-pass", "bad$hash")]
+    )
+    assert results == [True, False, True, False]
+    assert verify_passwords([]) == []
@@ -1,3 +1,5 @@
+import json
+import struct
 import sys
 from decimal import Decimal
 from pathlib import Path
@@ -7,6 +9,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from tinydb_engine import TinyDB
+from tinydb_engine.storage.record import decode_row, encode_row
 
 
 def test_decimal_type_round_trip_and_where(tmp_path):
@@ -86,3 +89,13 @@ def test_blob_type_round_trip(tmp_path):
         assert rows == [{"payload": b"abc\x00xyz"}]
     finally:
         db.close()
+
+
+def test_row_codec_round_trips_types_and_reads_legacy_json_rows():
+    values = [None, 7, -(2**40), 2**70, 1.5, "h\u00e9llo", True, False, b"\x00\xff", Decimal("1.10")]
+    decoded = decode_row(encode_row(values))
+    assert decoded == values
+    assert [type(value) for value in decoded] == [type(value) for value in values]
+
+    payload = json.dumps([1, "a", {"__type__": "decimal", "value": "2.5"}]).encode("utf-8")
+    assert decode_row(struct.pack("<I", len(payload)) + payload) == [1, "a", Decimal("2.5")]
@@ -1,4 +1,4 @@
 from .api import TinyDB
-from .security import hash_password, verify_password
+from .security import hash_password, verify_password, verify_passwords
 
-__all__ = ["TinyDB", "hash_password", "verify_password"]
+__all__ = ["TinyDB", "hash_password", "verify_password", "verify_passwords"]
@@ -7,7 +7,7 @@ from typing import Any, List, Optional, Sequence, Tuple
 Predicate = Tuple[str, str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnDef:
     name: str
     data_type: str
@@ -19,13 +19,13 @@ class ColumnDef:
     check_exprs: Sequence[str] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WhereClause:
     # OR of AND groups. Each inner list is AND-combined predicates.
     groups: List[List[Predicate]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateTableStmt:
     table_name: str
     columns: Sequence[ColumnDef]
@@ -35,7 +35,7 @@ class CreateTableStmt:
     if_not_exists: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InsertStmt:
     table_name: str
     columns: Optional[Sequence[str]]
@@ -43,7 +43,7 @@ class InsertStmt:
     or_replace: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SelectStmt:
     table_name: str
     columns: Sequence[str]
@@ -60,7 +60,7 @@ class SelectStmt:
     limit: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JoinClause:
     join_type: str
     table_name: str
@@ -68,107 +68,107 @@ class JoinClause:
     right_column: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateStmt:
     table_name: str
     assignments: Sequence[Tuple[str, Any]]
     where: Optional[WhereClause] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteStmt:
     table_name: str
     where: Optional[WhereClause] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DropTableStmt:
     table_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateIndexStmt:
     index_name: str
     table_name: str
     column_names: Sequence[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DropIndexStmt:
     index_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShowIndexesStmt:
     table_name: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShowStatsStmt:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExplainStmt:
     statement: "Statement"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileStmt:
     statement: "Statement"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlterTableRenameStmt:
     table_name: str
     new_table_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlterTableRenameColumnStmt:
     table_name: str
     old_column_name: str
     new_column_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlterTableAddColumnStmt:
     table_name: str
     column: ColumnDef
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlterTableRemoveColumnStmt:
     table_name: str
     column_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BeginStmt:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommitStmt:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RollbackStmt:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShowTablesStmt:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DescribeTableStmt:
     table_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReindexStmt:
     table_name: str
 
@@ -31,6 +31,7 @@ from tinydb_engine.ast_nodes import (
     WhereClause,
 )
 from tinydb_engine.index.btree import BTreeIndex
+from tinydb_engine.parser import parse_literal
 from tinydb_engine.schema import ColumnSchema, TableSchema, coerce_value, normalize_type
 from tinydb_engine.storage.catalog import Catalog
 from tinydb_engine.storage.pager import PAGE_SIZE, Pager
@@ -38,6 +39,7 @@ from tinydb_engine.storage.record import decode_row, encode_row
 
 SLOT_STRUCT = struct.Struct("<HHH")
 PAGE_HEADER_STRUCT = struct.Struct("<HH")
+CHECK_TOKEN_RE = re.compile(r"\s*(<=|>=|!=|=|<|>|\(|\)|\+|-|\*|/|'(?:''|[^'])*'|-?\d+\.\d+|-?\d+|[A-Za-z_][A-Za-z0-9_]*)")
 
 
 class Executor:
@@ -217,6 +219,8 @@ class Executor:
             rebuilt_secondary.append(new_meta)
             secondary_builders.append((new_meta, col_indices, sec_btree))
 
+        pk_items: List[Tuple[Any, Tuple[int, int]]] = []
+        secondary_items: List[List[Tuple[Any, Tuple[int, int]]]] = [[] for _ in secondary_builders]
         for row in rows:
             values = row["values"]
             location = (row["page_id"], row["slot_id"])
@@ -225,15 +229,19 @@ class Executor:
                 pk_value = self._pk_value(values, pk_indices)
                 if pk_value is None:
                     raise ValueError("PRIMARY KEY cannot be NULL")
-                if pk_btree.find(pk_value) is not None:
-                    raise ValueError("Duplicate primary key")
-                pk_btree.insert(pk_value, location)
+                pk_items.append((pk_value, location))
 
-            for _meta, col_indices, sec_btree in secondary_builders:
+            for (_meta, col_indices, _sec_btree), items in zip(secondary_builders, secondary_items):
                 key = self._index_key(values, col_indices)
                 if key is None:
                     continue
-                sec_btree.insert_non_unique(key, location)
+                items.append((key, location))
+
+        if pk_btree is not None:
+            pk_btree.insert_many(pk_items)
+        for (meta, _col_indices, sec_btree), items in zip(secondary_builders, secondary_items):
+            sec_btree.insert_many_non_unique(items)
+            meta["root_page"] = sec_btree.root_page_id
 
         if pk_btree is not None:
             schema.pk_index_root_page = pk_btree.root_page_id
@@ -351,6 +359,7 @@ class Executor:
                     raise ValueError("Cannot remove a column with an index")
 
         del schema.columns[remove_idx]
+        schema.refresh_columns()
         self.catalog.save(self.schemas)
         return "OK"
 
@@ -370,11 +379,13 @@ class Executor:
         normalized_col_names = [schema.columns[idx].name for idx in col_indices]
 
         btree = BTreeIndex.create(self.pager)
+        items = []
         for row in self._scan_rows(schema):
             key = self._index_key(row["values"], col_indices)
             if key is None:
                 continue
-            btree.insert_non_unique(key, (row["page_id"], row["slot_id"]))
+            items.append((key, (row["page_id"], row["slot_id"])))
+        btree.insert_many_non_unique(items)
 
         schema.secondary_indexes.append(
             {
@@ -419,6 +430,7 @@ class Executor:
                 raise ValueError(f"Column already exists: {stmt.new_column_name}")
 
         schema.columns[old_idx].name = stmt.new_column_name
+        schema.refresh_columns()
         for idx in schema.secondary_indexes or []:
             cols = self._index_columns(idx)
             changed = False
@@ -459,6 +471,7 @@ class Executor:
                 check_exprs=list(stmt.column.check_exprs),
             )
         )
+        schema.refresh_columns()
         self.catalog.save(self.schemas)
         return "OK"
 
@@ -1016,17 +1029,13 @@ class Executor:
         return bool(value)
 
     def _tokenize_check_expr(self, expr: str) -> List[str]:
-        token_re = re.compile(
-            r"\s*(<=|>=|!=|=|<|>|\(|\)|\+|-|\*|/|\bAND\b|\bOR\b|\bTRUE\b|\bFALSE\b|\bNULL\b|'(?:''|[^'])*'|-?\d+\.\d+|-?\d+|[A-Za-z_][A-Za-z0-9_]*)",
-            re.IGNORECASE,
-        )
         tokens: List[str] = []
         pos = 0
         while pos < len(expr):
             if expr[pos].isspace():
                 pos += 1
                 continue
-            m = token_re.match(expr, pos)
+            m = CHECK_TOKEN_RE.match(expr, pos)
             if m is None:
                 snippet = expr[pos : pos + 24]
                 raise ValueError(f"Unsupported CHECK expression near: {snippet!r}")
@@ -1123,13 +1132,7 @@ class Executor:
         col = next((c for c in schema.columns if c.name.lower() == token.lower()), None)
         if col is not None:
             return row_map.get(col.name)
-        if token.startswith("'") and token.endswith("'"):
-            return token[1:-1].replace("''", "'")
-        if re.fullmatch(r"-?\d+\.\d+", token):
-            return float(token)
-        if re.fullmatch(r"-?\d+", token):
-            return int(token)
-        return token
+        return parse_literal(token)
 
     def _assert_not_referenced(self, schema: TableSchema, row_values: List[Any]) -> None:
         for child_schema in self.schemas.values():
@@ -1186,10 +1189,12 @@ class Executor:
             self.catalog.save(self.schemas)
         return affected
 
-    def _pk_indices(self, schema: TableSchema) -> List[int]:
-        return [idx for idx, col in enumerate(schema.columns) if col.primary_key]
+    def _pk_indices(self, schema: TableSchema) -> Sequence[int]:
+        return schema.pk_indices
 
     def _pk_value(self, values: Sequence[Any], pk_indices: Sequence[int]) -> Any:
+        if len(pk_indices) == 1:
+            return values[pk_indices[0]]
         key_parts = [values[idx] for idx in pk_indices]
         if any(part is None for part in key_parts):
             return None
@@ -1390,14 +1395,12 @@ class Executor:
         col_idx = schema.column_index(left_col)
         left = row_values[col_idx]
 
-        from tinydb_engine.parser import _parse_literal
-
-        right_raw = _parse_literal(right_token)
+        right_raw = parse_literal(right_token)
         right = coerce_value(right_raw, schema.columns[col_idx].data_type) if right_raw is not None else None
         if not self._compare(left, op, right):
             return None
 
-        then_val = _parse_literal(then_expr)
+        then_val = parse_literal(then_expr)
         if then_val is None:
             return None
         return then_val
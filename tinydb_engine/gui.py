@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import argparse
+import base64
 import csv
+import http.client
 import json
 import logging
 import os
@@ -10,7 +12,7 @@ import threading
 import time
 import tkinter as tk
 import traceback
-import urllib.error
+import urllib.parse
 import urllib.request
 from tkinter import filedialog, messagebox, simpledialog, ttk
 from typing import Any
@@ -18,6 +20,11 @@ from typing import Any
 from tinydb_engine import TinyDB
 from tinydb_engine.parser import ParseError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 SQL_KEYWORDS = {
     "ADD",
@@ -101,10 +108,19 @@ SQL_KEYWORDS = {
 }
 
 SQL_TYPES = {"INTEGER", "TEXT", "REAL", "BOOLEAN", "TIMESTAMP", "BLOB", "DECIMAL", "NUMERIC"}
+AUTOCOMPLETE_STATIC_TERMS = frozenset(SQL_KEYWORDS | SQL_TYPES)
+MUTATING_SQL_VERBS = frozenset({"INSERT", "UPDATE", "DELETE", "ALTER", "DROP", "CREATE"})
 
 CLAUDE_MODEL = "claude-3-haiku-20240307"
+CLAUDE_API_HOST = "api.anthropic.com"
+CLAUDE_API_PATH = "/v1/messages"
+CLAUDE_API_HEADERS = {
+    "content-type": "application/json",
+    "anthropic-version": "2023-06-01",
+}
 AI_SAMPLE_ROW_LIMIT = 3
 QUERY_HISTORY_LIMIT = 100
+OUTPUT_LINE_LIMIT = 2000
 GUI_LOG_FILE = "tinydb_gui.log"
 GUI_CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".tinydb_gui_config.json")
 
@@ -190,6 +206,26 @@ def _format_table(rows: list[dict[str, Any]]) -> str:
     return "\n".join([border, header, border, *body, border, f"({len(rows)} row(s))"])
 
 
+def _cell_search_text(row: dict[str, Any], columns: list[str]) -> list[str]:
+    cells: list[str] = []
+    for col in columns:
+        value = row.get(col, "")
+        cells.append((value if type(value) is str else str(value)).lower())
+    return cells
+
+
+def _json_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _json_loads(text: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 def _parse_editor_value(data_type: str, text: str) -> Any:
     raw = text.strip()
     if raw.upper() == "NULL":
@@ -208,19 +244,14 @@ def _parse_editor_value(data_type: str, text: str) -> Any:
     return text
 
 
-def _to_sql_literal(value: Any) -> str:
-    if value is None:
-        return "NULL"
-    if isinstance(value, bool):
-        return "TRUE" if value else "FALSE"
-    if isinstance(value, (int, float)):
-        return str(value)
-    text = str(value)
-    text = text.replace("'", "''")
-    return f"'{text}'"
-
-
 class TinyDBGui:
+    _RE_STR = re.compile(r"'[^']*'")
+    _MULTILINE_DELIMITERS = ("'", "--", "/*", "*/")
+    _RE_NUM = re.compile(r"\b\d+(?:\.\d+)?\b")
+    _RE_WORD = re.compile(r"\b[A-Za-z_][A-Za-z0-9_]*\b")
+    _RE_WORD_LEFT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*$")
+    _RE_WORD_RIGHT = re.compile(r"[A-Za-z0-9_]*")
+
     def __init__(self, root: tk.Tk, db_path: str | None):
         self.root = root
         self.root.title("TinyDB Viewer")
@@ -249,10 +280,21 @@ class TinyDBGui:
         self.guardrail_mode_var = tk.StringVar(value="Off")
         self.autocomplete_popup: tk.Toplevel | None = None
         self.autocomplete_list: tk.Listbox | None = None
+        self._autocomplete_last_options: list[str] = []
+        # (word start, prefix) the visible popup was shown for; None while it is hidden.
+        self._autocomplete_word: tuple[str, str] | None = None
+        self._autocomplete_terms_cache: list[str] | None = None
         self.ai_request_inflight = False
+        self._claude_conn: http.client.HTTPSConnection | None = None
+        self._claude_lock = threading.Lock()
         self.last_error_details = ""
         self.last_result_rows: list[dict[str, Any]] = []
+        self._last_result_columns: tuple[str, ...] | None = None
         self.last_query_ms = 0.0
+        self._highlight_lines: list[str] = []
+        self._pending_output: list[tuple[str, str]] = []
+        self._output_flush_scheduled = False
+        self._ai_schema_context_cache: tuple[tuple[Any, ...], str, str] | None = None
         self.log_file_path = os.path.abspath(GUI_LOG_FILE)
         self.logger = self._build_logger()
 
@@ -683,6 +725,7 @@ class TinyDBGui:
             if self.db is not None:
                 self.db.close()
             self.db = TinyDB(path)
+            self._invalidate_ai_schema_context()
             self.db_path_var.set(path)
             self._save_config()
             self._print_output(f"Opened: {path}", level="INFO")
@@ -695,6 +738,7 @@ class TinyDBGui:
     def refresh_metadata(self) -> None:
         if self.db is None:
             return
+        self._autocomplete_terms_cache = None
         self.table_list.delete(0, tk.END)
         schemas = self.db.executor.schemas
         for table_name in sorted(table.name for table in schemas.values()):
@@ -1054,10 +1098,15 @@ class TinyDBGui:
         x_scroll = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=tree.xview)
         tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
 
-        rows_by_item: dict[str, dict[str, Any]] = {}
+        # Per-row state kept as parallel lists indexed by position in all_rows.
         all_rows: list[dict[str, Any]] = []
+        row_items: list[str] = []
+        row_haystacks: list[str] = []
+        item_to_idx: dict[str, int] = {}
+        sorted_indices_cache: dict[tuple[str, bool], list[int]] = {}
         sort_column: str | None = None
         sort_desc = False
+        marked_heading: str | None = None
         status_var = tk.StringVar(value="(0 rows)")
 
         def _sort_key(row: dict[str, Any], column: str) -> tuple[int, str]:
@@ -1067,44 +1116,46 @@ class TinyDBGui:
             return (0, str(value).lower())
 
         def _refresh_headings() -> None:
-            for heading_col in columns:
-                marker = ""
-                if heading_col == sort_column:
-                    marker = " ▼" if sort_desc else " ▲"
-                tree.heading(
-                    heading_col,
-                    text=f"{heading_col}{marker}",
-                    command=lambda c=heading_col: on_sort(c),
-                )
+            # Heading commands are bound once below; only the arrow markers move.
+            nonlocal marked_heading
+            if marked_heading is not None and marked_heading != sort_column:
+                tree.heading(marked_heading, text=marked_heading)
+            if sort_column is not None:
+                marker = " ▼" if sort_desc else " ▲"
+                tree.heading(sort_column, text=f"{sort_column}{marker}")
+            marked_heading = sort_column
 
-        def _render_rows(rows: list[dict[str, Any]]) -> None:
-            rows_by_item.clear()
-            tree.delete(*tree.get_children())
-            for row in rows:
-                item_id = tree.insert("", tk.END, values=[_scalar(row.get(col)) for col in columns])
-                rows_by_item[item_id] = row
+        def _render_rows(indices: list[int] | range) -> None:
+            # Items are created once per reload; filtering/sorting only re-links them.
+            tree.set_children("", *[row_items[idx] for idx in indices])
             if filter_var.get().strip():
-                status_var.set(f"{len(rows)} shown / {len(all_rows)} total")
+                status_var.set(f"{len(indices)} shown / {len(all_rows)} total")
             else:
-                status_var.set(f"{len(rows)} row(s)")
+                status_var.set(f"{len(indices)} row(s)")
+
+        def _sorted_indices() -> list[int] | range:
+            if sort_column is None:
+                return range(len(all_rows))
+            cache_key = (sort_column, sort_desc)
+            cached = sorted_indices_cache.get(cache_key)
+            if cached is None:
+                # Decorate once per row; the index keeps equal keys in their original order.
+                decorated = [
+                    (_sort_key(row, sort_column), -idx if sort_desc else idx, idx)
+                    for idx, row in enumerate(all_rows)
+                ]
+                decorated.sort(reverse=sort_desc)
+                cached = [idx for _key, _order, idx in decorated]
+                sorted_indices_cache[cache_key] = cached
+            return cached
 
         def apply_filter_and_sort() -> None:
             query = filter_var.get().strip().lower()
-            filtered_rows = all_rows
+            # Sorting the full row set first lets filtering reuse the cached order.
+            indices = _sorted_indices()
             if query:
-                filtered_rows = [
-                    row
-                    for row in all_rows
-                    if any(query in str(row.get(col, "")).lower() for col in columns)
-                ]
-
-            if sort_column is not None:
-                filtered_rows = sorted(
-                    filtered_rows,
-                    key=lambda row: _sort_key(row, sort_column),
-                    reverse=sort_desc,
-                )
-            _render_rows(filtered_rows)
+                indices = [idx for idx in indices if query in row_haystacks[idx]]
+            _render_rows(indices)
 
         def on_sort(column: str) -> None:
             nonlocal sort_column, sort_desc
@@ -1122,11 +1173,23 @@ class TinyDBGui:
 
         def reload_rows() -> None:
             nonlocal all_rows
+            self._invalidate_ai_schema_context()
             all_rows = self.db.execute(f"SELECT * FROM {table_name}")
+            sorted_indices_cache.clear()
+            # Filtered-out rows are detached, so get_children() would miss them; delete every loaded item.
+            if row_items:
+                tree.delete(*row_items)
+            item_to_idx.clear()
+            row_items.clear()
+            for idx, row in enumerate(all_rows):
+                item_id = tree.insert("", tk.END, values=[_scalar(row.get(col)) for col in columns])
+                item_to_idx[item_id] = idx
+                row_items.append(item_id)
+            # NUL separators keep a filter query from matching across two cells.
+            row_haystacks[:] = ["\0".join(_cell_search_text(row, columns)) for row in all_rows]
             apply_filter_and_sort()
 
         filter_var.trace_add("write", lambda *_: apply_filter_and_sort())
-        _refresh_headings()
 
         def edit_selected_row() -> None:
             selection = tree.selection()
@@ -1135,9 +1198,10 @@ class TinyDBGui:
                 return
 
             item_id = selection[0]
-            original = rows_by_item.get(item_id)
-            if original is None:
+            idx = item_to_idx.get(item_id)
+            if idx is None:
                 return
+            original = all_rows[idx]
 
             pk_col = schema.pk_column
             if pk_col is None:
@@ -1175,19 +1239,20 @@ class TinyDBGui:
             def save() -> None:
                 try:
                     assignments: list[str] = []
+                    params: list[Any] = []
                     for col in schema.columns:
                         if col.primary_key:
                             continue
-                        typed_value = _parse_editor_value(col.data_type, entries[col.name].get())
-                        assignments.append(f"{col.name} = {_to_sql_literal(typed_value)}")
+                        assignments.append(f"{col.name} = ?")
+                        params.append(_parse_editor_value(col.data_type, entries[col.name].get()))
 
                     if not assignments:
                         dialog.destroy()
                         return
 
-                    pk_value = _to_sql_literal(original.get(pk_col.name))
-                    sql = f"UPDATE {table_name} SET {', '.join(assignments)} WHERE {pk_col.name} = {pk_value}"
-                    self.db.execute(sql)
+                    params.append(original.get(pk_col.name))
+                    sql = f"UPDATE {table_name} SET {', '.join(assignments)} WHERE {pk_col.name} = ?"
+                    self.db.execute(sql, params)
                     reload_rows()
                     self.refresh_metadata()
                     dialog.destroy()
@@ -1238,17 +1303,17 @@ class TinyDBGui:
 
             def save_new() -> None:
                 try:
-                    ordered_values: list[str] = []
+                    ordered_values: list[Any] = []
                     for col in schema.columns:
                         raw_text = entries[col.name].get().strip()
                         if raw_text == "":
                             typed_value = None
                         else:
                             typed_value = _parse_editor_value(col.data_type, raw_text)
-                        ordered_values.append(_to_sql_literal(typed_value))
+                        ordered_values.append(typed_value)
 
-                    sql = f"INSERT INTO {table_name} VALUES ({', '.join(ordered_values)})"
-                    self.db.execute(sql)
+                    placeholders = ", ".join("?" for _ in ordered_values)
+                    self.db.execute(f"INSERT INTO {table_name} VALUES ({placeholders})", ordered_values)
                     reload_rows()
                     self.refresh_metadata()
                     dialog.destroy()
@@ -1272,9 +1337,10 @@ class TinyDBGui:
                 return
 
             item_id = selection[0]
-            original = rows_by_item.get(item_id)
-            if original is None:
+            idx = item_to_idx.get(item_id)
+            if idx is None:
                 return
+            original = all_rows[idx]
 
             should_delete = messagebox.askyesno(
                 "Delete Row",
@@ -1285,8 +1351,7 @@ class TinyDBGui:
                 return
 
             try:
-                pk_value = _to_sql_literal(original.get(pk_col.name))
-                self.db.execute(f"DELETE FROM {table_name} WHERE {pk_col.name} = {pk_value}")
+                self.db.execute(f"DELETE FROM {table_name} WHERE {pk_col.name} = ?", [original.get(pk_col.name)])
                 reload_rows()
                 self.refresh_metadata()
             except Exception as exc:
@@ -1479,24 +1544,70 @@ class TinyDBGui:
             self._print_output(f"AI error: {exc}. See log file for details.", level="ERROR")
             return None
 
-    def _call_claude(self, prompt: str, api_key: str, system_prompt: str = CLAUDE_SYSTEM_PROMPT) -> str:
-        model_name = self.claude_model_var.get().strip() or CLAUDE_MODEL
+    def _ai_schema_context(self) -> tuple[str, str]:
+        if self.db is None:
+            return "- (no tables)", "- (no sample rows)"
+
+        tables = sorted(self.db.executor.schemas.values(), key=lambda item: item.name.lower())
+        signature = tuple((table.name, tuple((col.name, col.data_type) for col in table.columns)) for table in tables)
+        cached = self._ai_schema_context_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1], cached[2]
 
         schema_lines: list[str] = []
         data_lines: list[str] = []
-        if self.db is not None:
-            for table in sorted(self.db.executor.schemas.values(), key=lambda item: item.name.lower()):
-                cols = ", ".join(f"{col.name}:{col.data_type}" for col in table.columns)
-                schema_lines.append(f"- {table.name}({cols})")
-                try:
-                    sample_rows = self.db.execute(f"SELECT * FROM {table.name} LIMIT {AI_SAMPLE_ROW_LIMIT}")
-                    data_lines.append(
-                        f"- {table.name}: {json.dumps(sample_rows, ensure_ascii=True)}"
-                    )
-                except Exception as exc:
-                    data_lines.append(f"- {table.name}: <sample unavailable: {exc}>")
+        for table in tables:
+            cols = ", ".join(f"{col.name}:{col.data_type}" for col in table.columns)
+            schema_lines.append(f"- {table.name}({cols})")
+            try:
+                sample_rows = self.db.execute(f"SELECT * FROM {table.name} LIMIT {AI_SAMPLE_ROW_LIMIT}")
+                data_lines.append(
+                    f"- {table.name}: {_json_dumps(sample_rows)}"
+                )
+            except Exception as exc:
+                data_lines.append(f"- {table.name}: <sample unavailable: {exc}>")
         schema_context = "\n".join(schema_lines) if schema_lines else "- (no tables)"
         data_context = "\n".join(data_lines) if data_lines else "- (no sample rows)"
+        self._ai_schema_context_cache = (signature, schema_context, data_context)
+        return schema_context, data_context
+
+    def _invalidate_ai_schema_context(self) -> None:
+        self._ai_schema_context_cache = None
+
+    def _post_claude(self, body: bytes, headers: dict[str, str]) -> tuple[int, bytes]:
+        with self._claude_lock:
+            while True:
+                conn = self._claude_conn
+                reused = conn is not None
+                if conn is None:
+                    conn = _claude_connection()
+                    self._claude_conn = conn
+                try:
+                    conn.request("POST", CLAUDE_API_PATH, body=body, headers=headers)
+                    response = conn.getresponse()
+                    return response.status, response.read()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    self._claude_conn = None
+                    # A kept-alive socket may have been closed by the server while idle; retry once fresh.
+                    # Timeouts and other errors are not retried: the server may already have the POST.
+                    if not reused:
+                        raise
+                except (http.client.HTTPException, OSError):
+                    conn.close()
+                    self._claude_conn = None
+                    raise
+
+    def close_claude_connection(self) -> None:
+        with self._claude_lock:
+            if self._claude_conn is not None:
+                self._claude_conn.close()
+                self._claude_conn = None
+
+    def _call_claude(self, prompt: str, api_key: str, system_prompt: str = CLAUDE_SYSTEM_PROMPT) -> str:
+        model_name = self.claude_model_var.get().strip() or CLAUDE_MODEL
+
+        schema_context, data_context = self._ai_schema_context()
 
         payload = {
             "model": model_name,
@@ -1517,33 +1628,25 @@ class TinyDBGui:
             ],
         }
 
-        request = urllib.request.Request(
-            "https://api.anthropic.com/v1/messages",
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "content-type": "application/json",
-                "x-api-key": api_key,
-                "anthropic-version": "2023-06-01",
-            },
-            method="POST",
-        )
-
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                body = response.read().decode("utf-8")
-        except urllib.error.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="replace")
-            if exc.code == 404 and "model" in detail.lower():
+            status, body = self._post_claude(
+                _json_dumps(payload).encode("utf-8"),
+                {**CLAUDE_API_HEADERS, "x-api-key": api_key},
+            )
+        except (http.client.HTTPException, OSError) as exc:
+            raise ValueError(f"Network error contacting Claude API: {exc}") from exc
+
+        if status >= 400:
+            detail = body.decode("utf-8", errors="replace")
+            if status == 404 and "model" in detail.lower():
                 raise ValueError(
                     f"Claude model not found: '{model_name}'. "
                     "Update the Model field in AI Assistant to one enabled on your account. "
                     f"API detail: {detail}"
-                ) from exc
-            raise ValueError(f"Claude API error ({exc.code}): {detail}") from exc
-        except urllib.error.URLError as exc:
-            raise ValueError(f"Network error contacting Claude API: {exc.reason}") from exc
+                )
+            raise ValueError(f"Claude API error ({status}): {detail}")
 
-        data = json.loads(body)
+        data = _json_loads(body)
         parts = data.get("content", [])
         texts: list[str] = []
         for part in parts:
@@ -1555,13 +1658,12 @@ class TinyDBGui:
 
     def _extract_sql(self, text: str) -> str:
         candidate = text.strip()
-        if candidate.startswith("```"):
-            lines = candidate.splitlines()
-            if lines and lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            candidate = "\n".join(lines).strip()
+        if not candidate.startswith("```"):
+            return candidate if candidate.endswith(";") else f"{candidate};"
+        lines = candidate.splitlines()[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        candidate = "\n".join(lines).strip()
         if candidate.endswith(";"):
             return candidate
         return f"{candidate};"
@@ -1572,11 +1674,7 @@ class TinyDBGui:
         self._highlight_sql()
 
     def _is_mutating_sql(self, sql: str) -> bool:
-        stripped = sql.strip().lstrip("(")
-        if not stripped:
-            return False
-        first = stripped.split(None, 1)[0].upper()
-        return first in {"INSERT", "UPDATE", "DELETE", "ALTER", "DROP", "CREATE"}
+        return self._sql_first_keyword(sql) in MUTATING_SQL_VERBS
 
     def _sql_first_keyword(self, sql: str) -> str:
         stripped = sql.strip().lstrip("(")
@@ -1612,6 +1710,8 @@ class TinyDBGui:
             self._set_diagnostics_text("")
             self._record_query_history(sql)
             self._print_output(f"Running SQL: {sql}", level="INFO")
+            if self._is_mutating_sql(sql):
+                self._invalidate_ai_schema_context()
             started = time.perf_counter()
             result = self.db.execute(sql)
             self.last_query_ms = (time.perf_counter() - started) * 1000.0
@@ -1788,9 +1888,9 @@ class TinyDBGui:
                 if not should_continue:
                     return
 
-                prepared_sql_values: list[list[str]] = []
+                prepared_values: list[list[Any]] = []
                 for line_no, row in enumerate(rows, start=2):
-                    values_sql: list[str] = []
+                    values: list[Any] = []
                     for col in schema.columns:
                         source_name = header_lookup.get(col.name.lower())
                         raw = row.get(source_name) if source_name is not None else None
@@ -1809,12 +1909,14 @@ class TinyDBGui:
                                     raise ValueError(
                                         f"Row {line_no}, column '{col.name}': invalid {col.data_type} value '{cleaned}'"
                                     ) from exc
-                        values_sql.append(_to_sql_literal(typed_value))
-                    prepared_sql_values.append(values_sql)
+                        values.append(typed_value)
+                    prepared_values.append(values)
 
+                self._invalidate_ai_schema_context()
+                insert_sql = f"INSERT INTO {table_name} VALUES ({', '.join('?' for _ in schema.columns)})"
                 inserted = 0
-                for values_sql in prepared_sql_values:
-                    self.db.execute(f"INSERT INTO {table_name} VALUES ({', '.join(values_sql)})")
+                for values in prepared_values:
+                    self.db.execute(insert_sql, values)
                     inserted += 1
 
             self.refresh_metadata()
@@ -1832,7 +1934,27 @@ class TinyDBGui:
 
     def _print_output(self, text: str, level: str = "INFO") -> None:
         tag = level if level in {"INFO", "ERROR", "WARN"} else "INFO"
-        self.output.insert(tk.END, f"[{tag}] {text}\n", tag)
+        self._pending_output.append((f"[{tag}] {text}\n", tag))
+        if not self._output_flush_scheduled:
+            self._output_flush_scheduled = True
+            self.root.after_idle(self._flush_output)
+
+    def _flush_output(self) -> None:
+        self._output_flush_scheduled = False
+        pending = self._pending_output
+        if not pending:
+            return
+        self._pending_output = []
+
+        chunks: list[str] = []
+        for text, tag in pending:
+            chunks.extend((text, tag))
+        self.output.insert(tk.END, *chunks)
+
+        line_count = int(self.output.index("end-1c").split(".")[0])
+        overflow = line_count - OUTPUT_LINE_LIMIT
+        if overflow > 0:
+            self.output.delete("1.0", f"{overflow + 1}.0")
         self.output.see(tk.END)
 
     def _log_exception(self, context: str, exc: Exception) -> None:
@@ -1842,40 +1964,70 @@ class TinyDBGui:
     def _clear_result_rows(self) -> None:
         self.result_tree.delete(*self.result_tree.get_children())
         self.result_tree["columns"] = ()
+        self._last_result_columns = None
         self.last_result_rows = []
 
     def _show_result_rows(self, rows: list[dict[str, Any]]) -> None:
-        self._clear_result_rows()
-        self.last_result_rows = list(rows)
         if not rows:
+            self._clear_result_rows()
             return
 
-        columns = list(rows[0].keys())
-        self.result_tree["columns"] = columns
-        for col in columns:
-            self.result_tree.heading(col, text=col)
-            self.result_tree.column(col, width=140, anchor=tk.W, stretch=True)
+        columns = tuple(rows[0].keys())
+        if columns == self._last_result_columns:
+            # Same shape as the previous result: keep the column layout, swap the rows.
+            self.result_tree.delete(*self.result_tree.get_children())
+        else:
+            self._clear_result_rows()
+            self.result_tree["columns"] = columns
+            for col in columns:
+                self.result_tree.heading(col, text=col)
+                self.result_tree.column(col, width=140, anchor=tk.W, stretch=True)
+            self._last_result_columns = columns
+        self.last_result_rows = list(rows)
         for row in rows:
             self.result_tree.insert("", tk.END, values=[_scalar(row.get(col)) for col in columns])
 
-    def _highlight_sql(self) -> None:
-        text = self.query_entry.get("1.0", "end-1c")
+    def _highlight_sql(self, incremental: bool = False) -> None:
+        lines = self.query_entry.get("1.0", "end-1c").split("\n")
+        previous, self._highlight_lines = self._highlight_lines, lines
+        start, end = "1.0", "end-1c"
+        row = int(self.query_entry.index("insert").split(".")[0]) - 1
+        if (
+            incremental
+            and len(lines) == len(previous)
+            and lines[:row] == previous[:row]
+            and lines[row + 1 :] == previous[row + 1 :]
+        ):
+            # Only the cursor line changed (pastes, undo and redo can touch others); skip re-scanning
+            # the rest unless the line holds (or held) part of a literal that may span other lines.
+            line_start = self.query_entry.index("insert linestart")
+            line_end = self.query_entry.index("insert lineend")
+            line = lines[row]
+            spans_lines = (
+                any(delimiter in line for delimiter in self._MULTILINE_DELIMITERS)
+                or self.query_entry.tag_nextrange("sql_string", line_start, line_end)
+                or "sql_string" in self.query_entry.tag_names(line_start)
+            )
+            if not spans_lines:
+                start, end = line_start, line_end
+
+        text = self.query_entry.get(start, end)
         for tag in ("sql_keyword", "sql_type", "sql_string", "sql_number"):
-            self.query_entry.tag_remove(tag, "1.0", tk.END)
+            self.query_entry.tag_remove(tag, start, end)
 
-        for match in re.finditer(r"'[^']*'", text):
+        for match in self._RE_STR.finditer(text):
             self.query_entry.tag_add(
                 "sql_string",
-                f"1.0+{match.start()}c",
-                f"1.0+{match.end()}c",
+                f"{start}+{match.start()}c",
+                f"{start}+{match.end()}c",
             )
-        for match in re.finditer(r"\b\d+(?:\.\d+)?\b", text):
+        for match in self._RE_NUM.finditer(text):
             self.query_entry.tag_add(
                 "sql_number",
-                f"1.0+{match.start()}c",
-                f"1.0+{match.end()}c",
+                f"{start}+{match.start()}c",
+                f"{start}+{match.end()}c",
             )
-        for match in re.finditer(r"\b[A-Za-z_][A-Za-z0-9_]*\b", text):
+        for match in self._RE_WORD.finditer(text):
             word = match.group(0).upper()
             tag = None
             if word in SQL_TYPES:
@@ -1885,20 +2037,20 @@ class TinyDBGui:
             if tag is not None:
                 self.query_entry.tag_add(
                     tag,
-                    f"1.0+{match.start()}c",
-                    f"1.0+{match.end()}c",
+                    f"{start}+{match.start()}c",
+                    f"{start}+{match.end()}c",
                 )
 
     def _on_query_key_release(self, event: tk.Event[tk.Text]) -> None:
         if event.keysym in {"Up", "Down", "Tab", "Escape", "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R"}:
             return
-        self._highlight_sql()
+        self._highlight_sql(incremental=True)
         self._refresh_autocomplete()
 
     def _on_query_tab(self, _event: tk.Event[tk.Text]) -> str:
-        if self.autocomplete_popup is None:
+        if self._autocomplete_word is None:
             self._refresh_autocomplete()
-        if self.autocomplete_popup is not None:
+        if self._autocomplete_word is not None:
             self._accept_autocomplete()
             return "break"
         self.query_entry.insert("insert", "    ")
@@ -1948,32 +2100,34 @@ class TinyDBGui:
         left = self.query_entry.get(line_start, cursor)
         right = self.query_entry.get(cursor, line_end)
 
-        left_match = re.search(r"[A-Za-z_][A-Za-z0-9_]*$", left)
+        left_match = self._RE_WORD_LEFT.search(left)
         if left_match is None:
             return None
 
-        right_match = re.match(r"[A-Za-z0-9_]*", right)
-        right_len = len(right_match.group(0)) if right_match is not None else 0
+        right_len = self._RE_WORD_RIGHT.match(right).end()
         prefix = left_match.group(0)
         start = self.query_entry.index(f"{cursor}-{len(prefix)}c")
-        end = self.query_entry.index(f"{cursor}+{right_len}c")
+        end = self.query_entry.index(f"{cursor}+{right_len}c") if right_len else cursor
         return start, end, prefix
 
     def _autocomplete_terms(self) -> list[str]:
-        terms = set(SQL_KEYWORDS) | set(SQL_TYPES)
+        if self._autocomplete_terms_cache is not None:
+            return self._autocomplete_terms_cache
+        terms = set(AUTOCOMPLETE_STATIC_TERMS)
         if self.db is not None:
             for schema in self.db.executor.schemas.values():
                 terms.add(schema.name)
                 for col in schema.columns:
                     terms.add(col.name)
-        return sorted(terms, key=lambda value: value.upper())
+        self._autocomplete_terms_cache = sorted(terms, key=str.upper)
+        return self._autocomplete_terms_cache
 
     def _refresh_autocomplete(self) -> None:
         bounds = self._autocomplete_word_bounds()
         if bounds is None:
             self._hide_autocomplete()
             return
-        _start, _end, prefix = bounds
+        start, _end, prefix = bounds
         prefix_upper = prefix.upper()
         if len(prefix_upper) < 2:
             self._hide_autocomplete()
@@ -1984,9 +2138,9 @@ class TinyDBGui:
         if not options:
             self._hide_autocomplete()
             return
-        self._show_autocomplete(options)
+        self._show_autocomplete(options, start, prefix)
 
-    def _show_autocomplete(self, options: list[str]) -> None:
+    def _show_autocomplete(self, options: list[str], word_start: str, prefix: str) -> None:
         if self.autocomplete_popup is None or self.autocomplete_list is None:
             popup = tk.Toplevel(self.root)
             popup.withdraw()
@@ -2007,15 +2161,35 @@ class TinyDBGui:
 
             self.autocomplete_popup = popup
             self.autocomplete_list = listbox
+            self._autocomplete_last_options = []
 
         assert self.autocomplete_popup is not None
         assert self.autocomplete_list is not None
 
-        self.autocomplete_list.delete(0, tk.END)
-        for option in options:
-            self.autocomplete_list.insert(tk.END, option)
-        self.autocomplete_list.selection_set(0)
-        self.autocomplete_list.activate(0)
+        previous = self._autocomplete_last_options
+        # Keep the highlighted option only while the same word's prefix is being extended.
+        shown_for = self._autocomplete_word
+        extending = shown_for is not None and shown_for[0] == word_start and prefix.startswith(shown_for[1])
+        selection = self.autocomplete_list.curselection() if extending else ()
+        selected_value = previous[selection[0]] if selection and selection[0] < len(previous) else None
+        self._autocomplete_word = (word_start, prefix)
+
+        # Only touch the rows after the longest shared prefix with the previous options.
+        keep = 0
+        for old_option, new_option in zip(previous, options):
+            if old_option != new_option:
+                break
+            keep += 1
+        if keep < len(previous):
+            self.autocomplete_list.delete(keep, tk.END)
+        if keep < len(options):
+            self.autocomplete_list.insert(tk.END, *options[keep:])
+        self._autocomplete_last_options = list(options)
+
+        selected_idx = options.index(selected_value) if selected_value in options else 0
+        self.autocomplete_list.selection_clear(0, tk.END)
+        self.autocomplete_list.selection_set(selected_idx)
+        self.autocomplete_list.activate(selected_idx)
 
         bbox = self.query_entry.bbox("insert")
         if bbox is None:
@@ -2046,10 +2220,28 @@ class TinyDBGui:
         self._highlight_sql()
 
     def _hide_autocomplete(self) -> None:
+        self._autocomplete_word = None
         if self.autocomplete_popup is not None:
             self.autocomplete_popup.withdraw()
 
 
+def _claude_connection() -> http.client.HTTPSConnection:
+    # Honor HTTPS_PROXY/NO_PROXY like urllib does, tunnelling through the proxy with CONNECT.
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(CLAUDE_API_HOST):
+        return http.client.HTTPSConnection(CLAUDE_API_HOST, timeout=30)
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    parts = urllib.parse.urlsplit(proxy)
+    conn = http.client.HTTPSConnection(parts.hostname or "", parts.port or 80, timeout=30)
+    tunnel_headers = {}
+    if parts.username:
+        credentials = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    conn.set_tunnel(CLAUDE_API_HOST, 443, headers=tunnel_headers)
+    return conn
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="TinyDB GUI viewer")
     parser.add_argument("db_path", nargs="?", help="Optional path to .db file")
@@ -2060,6 +2252,7 @@ def main() -> None:
 
     def on_close() -> None:
         app._save_config()
+        app.close_claude_connection()
         if app.db is not None:
             app.db.close()
         root.destroy()
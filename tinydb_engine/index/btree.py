@@ -3,34 +3,127 @@ from __future__ import annotations
 import bisect
 import json
 import struct
-from dataclasses import dataclass
+from collections import OrderedDict
+from decimal import Decimal
+from functools import lru_cache
+from itertools import chain
 from json import JSONDecodeError
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from tinydb_engine.storage.pager import PAGE_SIZE, Pager
 
-MAX_KEYS_PER_NODE = 16
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+NODE_CACHE_CAPACITY = 1024
+
+# Binary node layout: header, keys, child page ids, then leaf locations.
+# Keys are a packed int64 array when every key is a 64-bit int, otherwise each key is
+# tagged. Leaf values are (page_id, slot_id) pairs, or count-prefixed posting lists for
+# non-unique indexes.
+_NODE_MAGIC = b"BTN1"
+_NODE_HEADER = struct.Struct("<4sBHH")
+_FLAG_LEAF = 0x01
+_FLAG_INT_KEYS = 0x02
+_FLAG_POSTINGS = 0x04
+_KNOWN_FLAGS = _FLAG_LEAF | _FLAG_INT_KEYS | _FLAG_POSTINGS
+_U32 = struct.Struct("<I")
+_LOCATION = struct.Struct("<II")
+_ZERO_PAGE = memoryview(bytes(PAGE_SIZE))
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_INT_ONLY = frozenset((int,))
+
+_TAG_NULL = 0
+_TAG_INT = 1
+_TAG_REAL = 2
+_TAG_TEXT = 3
+_TAG_BOOL = 4
+_TAG_TUPLE = 5
+_TAG_BLOB = 6
+_TAG_DECIMAL = 7
+_TAG_BIGINT = 8
+_TAG = struct.Struct("<B")
+_TAG_INT_STRUCT = struct.Struct("<Bq")
+_TAG_REAL_STRUCT = struct.Struct("<Bd")
+_TAG_BOOL_STRUCT = struct.Struct("<B?")
+_TAG_TUPLE_STRUCT = struct.Struct("<BB")
+_TAG_SIZED_STRUCT = struct.Struct("<BH")
+
+# A node is split before it is descended into once its encoded size passes
+# NODE_SPLIT_BYTES; the remaining space absorbs the entry being inserted and a separator
+# pushed up by a child split. The key cap is what int64-keyed leaves reach at that size.
+NODE_SPLIT_BYTES = PAGE_SIZE - 1024
+MAX_KEYS_PER_NODE = (NODE_SPLIT_BYTES - _NODE_HEADER.size) // 16
 
 
-@dataclass
 class Node:
-    is_leaf: bool
-    keys: List[Any]
-    children: List[int]
-    values: List[Tuple[int, int]]
+    """One decoded B-tree page.
+
+    Keys and children are decoded eagerly because every descent bisects them. Plain leaf
+    locations stay in the page bytes until ``values`` is first used; ``value_at`` reads a
+    single location without decoding the rest.
+    """
+
+    __slots__ = ("is_leaf", "keys", "children", "size", "_values", "_raw", "_values_at", "_value_count")
+
+    def __init__(
+        self,
+        is_leaf: bool,
+        keys: List[Any],
+        children: List[int],
+        values: Optional[List[Any]],
+        size: int = 0,
+        raw: Optional[bytes] = None,
+        values_at: int = 0,
+    ):
+        self.is_leaf = is_leaf
+        self.keys = keys
+        self.children = children
+        self.size = size
+        self._values = values
+        self._raw = raw
+        self._values_at = values_at
+        self._value_count = len(keys)
+
+    @property
+    def values(self) -> List[Any]:
+        values = self._values
+        if values is None:
+            flat = _array_struct("I", 2 * self._value_count).unpack_from(self._raw, self._values_at)
+            values = self._values = list(zip(flat[::2], flat[1::2]))
+            self._raw = None
+        return values
+
+    @values.setter
+    def values(self, values: List[Any]) -> None:
+        self._values = values
+        self._raw = None
+
+    def value_at(self, i: int) -> Any:
+        if self._values is None:
+            return _LOCATION.unpack_from(self._raw, self._values_at + 8 * i)
+        return self._values[i]
 
 
 class BTreeIndex:
     """A small persisted B-tree for PRIMARY KEY lookup.
 
-    The implementation stores one node per page as JSON. This is not as compact as a
-    production engine, but keeping node serialization explicit makes balancing logic
-    easy to validate in tests.
+    The implementation stores one node per page in a small binary layout (see
+    ``_encode_node``). Nodes written by older versions as JSON are still readable and
+    are rewritten in the binary layout the next time they change.
     """
 
     def __init__(self, pager: Pager, root_page_id: int):
         self.pager = pager
         self.root_page_id = root_page_id
+        # Decoded nodes by page id. Nodes are mutated in place and written back through
+        # _write_node, which refreshes the entry, so a hit always matches the pager.
+        self._node_cache: OrderedDict[int, Node] = OrderedDict()
+        # Leaf reached by the last lookup; any node write clears it.
+        self._last_leaf: Optional[Node] = None
 
     @classmethod
     def create(cls, pager: Pager) -> "BTreeIndex":
@@ -43,49 +136,38 @@ class BTreeIndex:
         return idx
 
     def find(self, key: Any) -> Optional[Tuple[int, int]]:
-        node_page = self.root_page_id
-        while True:
-            node = self._read_node(node_page)
-            i = bisect.bisect_left(node.keys, key)
-            if node.is_leaf:
-                if i < len(node.keys) and node.keys[i] == key:
-                    return tuple(node.values[i])
-                return None
-            node_page = node.children[i]
+        node = self._find_leaf(key)
+        i = bisect.bisect_left(node.keys, key)
+        if i < len(node.keys) and node.keys[i] == key:
+            return node.value_at(i)
+        return None
 
     def insert(self, key: Any, value: Tuple[int, int]) -> None:
-        root = self._read_node(self.root_page_id)
-        if len(root.keys) >= MAX_KEYS_PER_NODE:
-            new_root_page = self.pager.allocate_page()
-            new_root = Node(is_leaf=False, keys=[], children=[self.root_page_id], values=[])
-            self._write_node(new_root_page, new_root)
-            self._split_child(new_root_page, 0)
-            self.root_page_id = new_root_page
-        self._insert_non_full(self.root_page_id, key, value)
+        page_id, leaf, _upper = self._leaf_for_insert(key)
+        _add_to_leaf(leaf, key, value, unique=True)
+        self._write_node(page_id, leaf)
+
+    def insert_many(self, items: Iterable[Tuple[Any, Tuple[int, int]]]) -> None:
+        """Insert ``(key, location)`` pairs, writing each leaf once per run of keys it holds."""
+        self._insert_batch(items, unique=True)
 
     def find_all(self, key: Any) -> List[Tuple[int, int]]:
-        node_page = self.root_page_id
-        while True:
-            node = self._read_node(node_page)
-            i = bisect.bisect_left(node.keys, key)
-            if node.is_leaf:
-                if i < len(node.keys) and node.keys[i] == key:
-                    raw_value = node.values[i]
-                    if isinstance(raw_value, list):
-                        return [tuple(v) for v in raw_value]
-                    return [tuple(raw_value)]
-                return []
-            node_page = node.children[i]
+        node = self._find_leaf(key)
+        i = bisect.bisect_left(node.keys, key)
+        if i < len(node.keys) and node.keys[i] == key:
+            raw_value = node.value_at(i)
+            if isinstance(raw_value, list):
+                return list(raw_value)
+            return [raw_value]
+        return []
 
     def insert_non_unique(self, key: Any, value: Tuple[int, int]) -> None:
-        root = self._read_node(self.root_page_id)
-        if len(root.keys) >= MAX_KEYS_PER_NODE:
-            new_root_page = self.pager.allocate_page()
-            new_root = Node(is_leaf=False, keys=[], children=[self.root_page_id], values=[])
-            self._write_node(new_root_page, new_root)
-            self._split_child(new_root_page, 0)
-            self.root_page_id = new_root_page
-        self._insert_non_full_non_unique(self.root_page_id, key, value)
+        page_id, leaf, _upper = self._leaf_for_insert(key)
+        _add_to_leaf(leaf, key, value, unique=False)
+        self._write_node(page_id, leaf)
+
+    def insert_many_non_unique(self, items: Iterable[Tuple[Any, Tuple[int, int]]]) -> None:
+        self._insert_batch(items, unique=False)
 
     def delete_non_unique(self, key: Any, value: Tuple[int, int]) -> bool:
         node_page = self.root_page_id
@@ -96,25 +178,26 @@ class BTreeIndex:
                 if i >= len(node.keys) or node.keys[i] != key:
                     return False
                 raw_value = node.values[i]
+                value = tuple(value)
                 if not isinstance(raw_value, list):
-                    if tuple(raw_value) == value:
+                    if raw_value == value:
                         node.keys.pop(i)
                         node.values.pop(i)
                         self._write_node(node_page, node)
                         return True
                     return False
-                postings = [tuple(v) for v in raw_value]
-                if value not in postings:
+                # Postings hold tuples in insertion order (find_all returns them in that
+                # order), so remove in place with a single C-level scan.
+                try:
+                    raw_value.remove(value)
+                except ValueError:
                     return False
-                postings.remove(value)
-                if postings:
-                    node.values[i] = postings
-                else:
+                if not raw_value:
                     node.keys.pop(i)
                     node.values.pop(i)
                 self._write_node(node_page, node)
                 return True
-            node_page = node.children[i]
+            node_page = node.children[bisect.bisect_right(node.keys, key, i)]
 
     def delete(self, key: Any) -> bool:
         # For MVP we implement delete only at leaf level by traversing to the key location.
@@ -133,77 +216,111 @@ class BTreeIndex:
                     return True
                 return False
             parent_page = node_page
-            child_index = i
-            node_page = node.children[i]
+            child_index = bisect.bisect_right(node.keys, key, i)
+            node_page = node.children[child_index]
 
     def scan_items(self) -> List[Tuple[Any, Tuple[int, int]]]:
         items: List[Tuple[Any, Tuple[int, int]]] = []
-        self._collect(self.root_page_id, items)
+        # A full scan would cycle every page through the LRU and evict the lookup working
+        # set, so pages that are not already cached are decoded without being cached.
+        cache = self._node_cache
+        stack = [self.root_page_id]
+        while stack:
+            page_id = stack.pop()
+            node = cache.get(page_id)
+            if node is None:
+                node = self._load_node(page_id)
+            if node.is_leaf:
+                values = node.values
+                if list in set(map(type, values)):
+                    items.extend((k, tuple(v)) for k, v in zip(node.keys, values))
+                else:
+                    items.extend(zip(node.keys, values))
+            else:
+                # Reversed so the leftmost child is popped (and emitted) first.
+                stack.extend(reversed(node.children))
         return items
 
-    def _collect(self, page_id: int, out: List[Tuple[Any, Tuple[int, int]]]) -> None:
-        node = self._read_node(page_id)
-        if node.is_leaf:
-            out.extend((k, tuple(v)) for k, v in zip(node.keys, node.values))
-            return
-        for child in node.children:
-            self._collect(child, out)
-
-    def _insert_non_full(self, page_id: int, key: Any, value: Tuple[int, int]) -> None:
-        node = self._read_node(page_id)
-        if node.is_leaf:
-            idx = bisect.bisect_left(node.keys, key)
-            if idx < len(node.keys) and node.keys[idx] == key:
-                raise ValueError("Duplicate primary key")
-            node.keys.insert(idx, key)
-            node.values.insert(idx, value)
-            self._write_node(page_id, node)
-            return
-
-        idx = bisect.bisect_left(node.keys, key)
-        child_page = node.children[idx]
-        child = self._read_node(child_page)
-        if len(child.keys) >= MAX_KEYS_PER_NODE:
-            self._split_child(page_id, idx)
-            node = self._read_node(page_id)
-            if key > node.keys[idx]:
-                idx += 1
-        self._insert_non_full(node.children[idx], key, value)
-
-    def _insert_non_full_non_unique(self, page_id: int, key: Any, value: Tuple[int, int]) -> None:
+    def _find_leaf(self, key: Any) -> Node:
+        """Return the leaf that holds ``key`` if it is present.
+
+        Clustered lookups usually land in the leaf of the previous call, so that leaf is
+        reused without descending again when ``key`` lies within its key range.
+        """
+        node = self._last_leaf
+        if node is not None and node.keys[0] <= key <= node.keys[-1]:
+            return node
+        # Hot loop: probe the node cache inline rather than through _read_node.
+        cache = self._node_cache
+        bisect_right = bisect.bisect_right
+        node_page = self.root_page_id
+        while True:
+            node = cache.get(node_page)
+            if node is None:
+                node = self._read_node(node_page)
+            else:
+                cache.move_to_end(node_page)
+            if node.is_leaf:
+                if node.keys:
+                    self._last_leaf = node
+                return node
+            # Leaf splits keep the separator key in the right sibling.
+            node_page = node.children[bisect_right(node.keys, key)]
+
+    def _insert_batch(self, items: Iterable[Tuple[Any, Tuple[int, int]]], unique: bool) -> None:
+        # Keys arrive sorted, so consecutive keys below the leaf's upper separator stay in
+        # that leaf; it is only written when the run ends or the leaf needs splitting.
+        leaf_page = -1
+        leaf: Optional[Node] = None
+        upper: Any = None
+        try:
+            for key, value in sorted(items, key=lambda item: item[0]):
+                if leaf is None or (upper is not None and key >= upper) or _is_full(leaf):
+                    if leaf is not None:
+                        self._write_node(leaf_page, leaf)
+                        leaf = None
+                    leaf_page, leaf, upper = self._leaf_for_insert(key)
+                _add_to_leaf(leaf, key, value, unique)
+                leaf.size += _entry_size(key, value if unique else [value])
+        finally:
+            if leaf is not None:
+                self._write_node(leaf_page, leaf)
+
+    def _leaf_for_insert(self, key: Any) -> Tuple[int, Node, Any]:
+        """Descend to the leaf for ``key``, splitting full nodes on the way down.
+
+        Also returns the nearest separator above ``key`` on the path (``None`` when there
+        is none); every key below it belongs to the same leaf.
+        """
+        page_id = self.root_page_id
         node = self._read_node(page_id)
-        if node.is_leaf:
-            idx = bisect.bisect_left(node.keys, key)
-            if idx < len(node.keys) and node.keys[idx] == key:
-                raw_value = node.values[idx]
-                if isinstance(raw_value, list):
-                    raw_value.append(tuple(value))
-                    node.values[idx] = raw_value
-                else:
-                    node.values[idx] = [tuple(raw_value), tuple(value)]
-                self._write_node(page_id, node)
-                return
-            node.keys.insert(idx, key)
-            node.values.insert(idx, [tuple(value)])
-            self._write_node(page_id, node)
-            return
-
-        idx = bisect.bisect_left(node.keys, key)
-        child_page = node.children[idx]
-        child = self._read_node(child_page)
-        if len(child.keys) >= MAX_KEYS_PER_NODE:
-            self._split_child(page_id, idx)
-            node = self._read_node(page_id)
-            if key > node.keys[idx]:
-                idx += 1
-        self._insert_non_full_non_unique(node.children[idx], key, value)
-
-    def _split_child(self, parent_page: int, child_index: int) -> None:
-        parent = self._read_node(parent_page)
+        if _is_full(node):
+            new_root_page = self.pager.allocate_page()
+            new_root = Node(is_leaf=False, keys=[], children=[page_id], values=[])
+            self._split_child(new_root, new_root_page, 0)
+            self.root_page_id = page_id = new_root_page
+            node = new_root
+        upper = None
+        while not node.is_leaf:
+            idx = bisect.bisect_right(node.keys, key)
+            child = self._read_node(node.children[idx])
+            if _is_full(child):
+                self._split_child(node, page_id, idx)
+                if key >= node.keys[idx]:
+                    idx += 1
+                child = self._read_node(node.children[idx])
+            if idx < len(node.keys):
+                upper = node.keys[idx]
+            page_id = node.children[idx]
+            node = child
+        return page_id, node, upper
+
+    def _split_child(self, parent: Node, parent_page: int, child_index: int) -> None:
+        """Split ``parent``'s full child in place; ``parent`` is updated and written back."""
         child_page = parent.children[child_index]
         child = self._read_node(child_page)
 
-        mid = len(child.keys) // 2
+        mid = _split_point(child)
         median_key = child.keys[mid]
 
         new_page = self.pager.allocate_page()
@@ -239,8 +356,34 @@ class BTreeIndex:
         self._write_node(parent_page, parent)
 
     def _read_node(self, page_id: int) -> Node:
+        cache = self._node_cache
+        node = cache.get(page_id)
+        if node is not None:
+            cache.move_to_end(page_id)
+            return node
+        node = self._load_node(page_id)
+        self._cache_node(page_id, node)
+        return node
+
+    def _cache_node(self, page_id: int, node: Node) -> None:
+        cache = self._node_cache
+        cache[page_id] = node
+        cache.move_to_end(page_id)
+        if len(cache) > NODE_CACHE_CAPACITY:
+            cache.popitem(last=False)
+
+    def _load_node(self, page_id: int) -> Node:
         raw = self.pager.read_page(page_id)
-        (size,) = struct.unpack("<I", raw[:4])
+        if raw[:4] != _NODE_MAGIC:
+            return self._read_legacy_node(page_id, raw)
+        try:
+            return _decode_node(raw)
+        except (struct.error, UnicodeDecodeError, ValueError) as exc:
+            raise ValueError(f"Corrupt B-tree node at page {page_id}: {exc}") from exc
+
+    def _read_legacy_node(self, page_id: int, raw: bytes) -> Node:
+        # Nodes written before the binary layout are a length-prefixed JSON document.
+        (size,) = _U32.unpack_from(raw)
         if size < 0 or size > PAGE_SIZE - 4:
             raise ValueError(f"Corrupt B-tree node at page {page_id}: invalid payload size {size}")
         if size == 0:
@@ -252,10 +395,16 @@ class BTreeIndex:
                     f"Corrupt B-tree node at page {page_id}: truncated payload ({len(payload_bytes)} < {size})"
                 )
             try:
-                payload = json.loads(payload_bytes.decode("utf-8"))
+                if orjson is not None:
+                    payload = orjson.loads(payload_bytes)
+                else:
+                    payload = json.loads(payload_bytes.decode("utf-8"))
             except (UnicodeDecodeError, JSONDecodeError) as exc:
                 raise ValueError(f"Corrupt B-tree node at page {page_id}: invalid JSON payload") from exc
-        keys = [self._normalize_key(item) for item in payload.get("keys", [])]
+        keys = payload.get("keys", [])
+        # Only composite keys need converting back from JSON arrays to tuples.
+        if list in set(map(type, keys)):
+            keys = [self._normalize_key(item) for item in keys]
         values: List[Any] = []
         for item in payload.get("values", []):
             if isinstance(item, list) and item and isinstance(item[0], list):
@@ -264,12 +413,14 @@ class BTreeIndex:
                 values.append(tuple(item))
             else:
                 values.append(item)
-        return Node(
+        node = Node(
             is_leaf=payload.get("is_leaf", True),
             keys=keys,
             children=payload.get("children", []),
             values=values,
         )
+        node.size = len(_encode_node(node))
+        return node
 
     def _normalize_key(self, key: Any) -> Any:
         if isinstance(key, list):
@@ -277,18 +428,218 @@ class BTreeIndex:
         return key
 
     def _write_node(self, page_id: int, node: Node) -> None:
-        payload = json.dumps(
-            {
-                "is_leaf": node.is_leaf,
-                "keys": node.keys,
-                "children": node.children,
-                "values": node.values,
-            },
-            separators=(",", ":"),
-        ).encode("utf-8")
-        if len(payload) + 4 > PAGE_SIZE:
+        self._last_leaf = None
+        parts = _node_parts(node)
+        size = sum(map(len, parts))
+        if size > PAGE_SIZE:
+            # The caller already mutated the cached node; drop it so the page is re-read.
+            self._node_cache.pop(page_id, None)
             raise ValueError("B-tree node too large for page")
-        page = bytearray(PAGE_SIZE)
-        page[:4] = struct.pack("<I", len(payload))
-        page[4 : 4 + len(payload)] = payload
-        self.pager.write_page(page_id, bytes(page))
+        # The pager keeps the page object in its transaction buffer, so it must be an
+        # immutable bytes. Joining the zero tail as a view builds it in one allocation.
+        parts.append(_ZERO_PAGE[: PAGE_SIZE - size])
+        self.pager.write_page(page_id, b"".join(parts))
+        node.size = size
+        self._cache_node(page_id, node)
+
+
+def _encode_node(node: Node) -> bytes:
+    return b"".join(_node_parts(node))
+
+
+def _node_parts(node: Node) -> List[bytes]:
+    keys = node.keys
+    key_count = len(keys)
+    flags = _FLAG_LEAF if node.is_leaf else 0
+    # Integer primary keys are the common case, so classify with C-level passes over the
+    # types; node keys are sorted, so the int64 range only needs checking at the ends.
+    int_keys = set(map(type, keys)) <= _INT_ONLY and (
+        not keys or (_INT64_MIN <= keys[0] and keys[-1] <= _INT64_MAX)
+    )
+    if int_keys:
+        flags |= _FLAG_INT_KEYS
+    postings = node.is_leaf and list in set(map(type, node.values))
+    if postings:
+        flags |= _FLAG_POSTINGS
+
+    parts = [_NODE_HEADER.pack(_NODE_MAGIC, flags, key_count, len(node.children))]
+    if int_keys:
+        parts.append(_array_struct("q", key_count).pack(*keys))
+    else:
+        for key in keys:
+            _encode_key(key, parts)
+    parts.append(_array_struct("I", len(node.children)).pack(*node.children))
+    if node.is_leaf:
+        if len(node.values) != key_count:
+            raise ValueError("B-tree leaf has mismatched keys and values")
+        if postings:
+            # Counts and locations are all uint32, so the whole section packs in one call.
+            flat: List[int] = []
+            for value in node.values:
+                locations = value if type(value) is list else [value]
+                flat.append(len(locations))
+                flat.extend(chain.from_iterable(locations))
+            parts.append(_array_struct("I", len(flat)).pack(*flat))
+        else:
+            parts.append(_array_struct("I", 2 * key_count).pack(*chain.from_iterable(node.values)))
+    return parts
+
+
+def _decode_node(raw: bytes) -> Node:
+    _magic, flags, key_count, child_count = _NODE_HEADER.unpack_from(raw, 0)
+    if flags & ~_KNOWN_FLAGS:
+        raise ValueError(f"unknown node flags {flags:#x}")
+    offset = _NODE_HEADER.size
+    if flags & _FLAG_INT_KEYS:
+        keys = list(_array_struct("q", key_count).unpack_from(raw, offset))
+        offset += 8 * key_count
+    else:
+        keys = []
+        for _ in range(key_count):
+            key, offset = _decode_key(raw, offset)
+            keys.append(key)
+    children = list(_array_struct("I", child_count).unpack_from(raw, offset))
+    offset += 4 * child_count
+
+    values: Optional[List[Any]] = []
+    is_leaf = bool(flags & _FLAG_LEAF)
+    if is_leaf:
+        if flags & _FLAG_POSTINGS:
+            words = _array_struct("I", (len(raw) - offset) // 4).unpack_from(raw, offset)
+            pos = 0
+            for _ in range(key_count):
+                end = pos + 1 + 2 * words[pos] if pos < len(words) else pos + 1
+                if end > len(words):
+                    raise ValueError("truncated postings list")
+                values.append(list(zip(words[pos + 1 : end : 2], words[pos + 2 : end : 2])))
+                pos = end
+            offset += 4 * pos
+        elif key_count:
+            values_at = offset
+            offset += 8 * key_count
+            if offset > len(raw):
+                raise ValueError("truncated leaf locations")
+            return Node(is_leaf, keys, children, None, size=offset, raw=raw, values_at=values_at)
+    return Node(is_leaf=is_leaf, keys=keys, children=children, values=values, size=offset)
+
+
+@lru_cache(maxsize=None)
+def _array_struct(code: str, count: int) -> struct.Struct:
+    # Node arrays are bounded by the page size, so only about a thousand formats exist.
+    return struct.Struct(f"<{count}{code}")
+
+
+def _is_full(node: Node) -> bool:
+    if len(node.keys) >= MAX_KEYS_PER_NODE:
+        return True
+    # A single oversized entry cannot be split any further.
+    return node.size > NODE_SPLIT_BYTES and len(node.keys) > 1
+
+
+def _split_point(node: Node) -> int:
+    keys = node.keys
+    if node.size <= NODE_SPLIT_BYTES:
+        return len(keys) // 2
+    # Split by encoded size so variable-length keys leave both halves room to grow.
+    half = node.size // 2
+    used = _NODE_HEADER.size
+    for i, key in enumerate(keys):
+        used += _entry_size(key, node.values[i] if node.is_leaf else None)
+        if used >= half:
+            return min(max(i, 1), len(keys) - 1)
+    return len(keys) // 2
+
+
+def _entry_size(key: Any, value: Any) -> int:
+    """Upper bound on the bytes a key and its location, postings or child id take up."""
+    parts: List[bytes] = []
+    _encode_key(key, parts)
+    size = sum(map(len, parts))
+    if value is None:
+        return size + 4
+    if isinstance(value, list):
+        return size + 4 + 8 * len(value)
+    return size + 8
+
+
+def _add_to_leaf(leaf: Node, key: Any, value: Tuple[int, int], unique: bool) -> None:
+    idx = bisect.bisect_left(leaf.keys, key)
+    if idx < len(leaf.keys) and leaf.keys[idx] == key:
+        if unique:
+            raise ValueError("Duplicate primary key")
+        raw_value = leaf.values[idx]
+        if isinstance(raw_value, list):
+            raw_value.append(tuple(value))
+        else:
+            leaf.values[idx] = [tuple(raw_value), tuple(value)]
+        return
+    leaf.keys.insert(idx, key)
+    # Locations are stored as tuples so lookups can return them without copying.
+    leaf.values.insert(idx, tuple(value) if unique else [tuple(value)])
+
+
+def _encode_key(key: Any, parts: List[bytes]) -> None:
+    if key is None:
+        parts.append(_TAG.pack(_TAG_NULL))
+    elif isinstance(key, bool):
+        parts.append(_TAG_BOOL_STRUCT.pack(_TAG_BOOL, key))
+    elif isinstance(key, int):
+        if _INT64_MIN <= key <= _INT64_MAX:
+            parts.append(_TAG_INT_STRUCT.pack(_TAG_INT, key))
+        else:
+            _encode_sized(_TAG_BIGINT, str(key).encode("ascii"), parts)
+    elif isinstance(key, float):
+        parts.append(_TAG_REAL_STRUCT.pack(_TAG_REAL, key))
+    elif isinstance(key, str):
+        _encode_sized(_TAG_TEXT, key.encode("utf-8"), parts)
+    elif isinstance(key, (bytes, bytearray)):
+        _encode_sized(_TAG_BLOB, bytes(key), parts)
+    elif isinstance(key, Decimal):
+        _encode_sized(_TAG_DECIMAL, str(key).encode("ascii"), parts)
+    elif isinstance(key, (tuple, list)):
+        parts.append(_TAG_TUPLE_STRUCT.pack(_TAG_TUPLE, len(key)))
+        for item in key:
+            _encode_key(item, parts)
+    else:
+        raise TypeError(f"Unsupported B-tree key type: {type(key).__name__}")
+
+
+def _encode_sized(tag: int, data: bytes, parts: List[bytes]) -> None:
+    parts.append(_TAG_SIZED_STRUCT.pack(tag, len(data)))
+    parts.append(data)
+
+
+def _decode_key(raw: bytes, offset: int) -> Tuple[Any, int]:
+    tag = raw[offset]
+    if tag == _TAG_INT:
+        return _TAG_INT_STRUCT.unpack_from(raw, offset)[1], offset + _TAG_INT_STRUCT.size
+    if tag == _TAG_TEXT:
+        (_tag, size) = _TAG_SIZED_STRUCT.unpack_from(raw, offset)
+        start = offset + _TAG_SIZED_STRUCT.size
+        return raw[start : start + size].decode("utf-8"), start + size
+    if tag == _TAG_REAL:
+        return _TAG_REAL_STRUCT.unpack_from(raw, offset)[1], offset + _TAG_REAL_STRUCT.size
+    if tag == _TAG_BOOL:
+        return bool(_TAG_BOOL_STRUCT.unpack_from(raw, offset)[1]), offset + _TAG_BOOL_STRUCT.size
+    if tag == _TAG_TUPLE:
+        (_tag, count) = _TAG_TUPLE_STRUCT.unpack_from(raw, offset)
+        offset += _TAG_TUPLE_STRUCT.size
+        items: List[Any] = []
+        for _ in range(count):
+            item, offset = _decode_key(raw, offset)
+            items.append(item)
+        return tuple(items), offset
+    if tag == _TAG_NULL:
+        return None, offset + 1
+    if tag in (_TAG_BLOB, _TAG_DECIMAL, _TAG_BIGINT):
+        (_tag, size) = _TAG_SIZED_STRUCT.unpack_from(raw, offset)
+        start = offset + _TAG_SIZED_STRUCT.size
+        data = bytes(raw[start : start + size])
+        if len(data) != size:
+            raise ValueError("truncated key payload")
+        if tag == _TAG_BLOB:
+            return data, start + size
+        if tag == _TAG_DECIMAL:
+            return Decimal(data.decode("ascii")), start + size
+        return int(data.decode("ascii")), start + size
+    raise ValueError(f"unknown key tag {tag}")
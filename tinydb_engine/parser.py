@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import Any, List, Sequence, Tuple
+import string
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 from .ast_nodes import (
     AlterTableAddColumnStmt,
@@ -32,10 +35,42 @@ from .ast_nodes import (
     WhereClause,
 )
 
-_TOKEN_RE = re.compile(
-    r"\s*(=>|<=|>=|!=|\bAND\b|\bOR\b|\bIN\b|\bIS\b|\bLIKE\b|\bJOIN\b|\bINNER\b|\bLEFT\b|\bON\b|\bINDEX\b|\bREINDEX\b|\bASC\b|\bDESC\b|\bLIMIT\b|\bORDER\b|\bGROUP\b|\bBY\b|\bHAVING\b|\bDISTINCT\b|\bWHERE\b|\bFROM\b|\bVALUES\b|\bINTO\b|\bTABLE\b|\bCREATE\b|\bINSERT\b|\bREPLACE\b|\bSELECT\b|\bUPDATE\b|\bDELETE\b|\bDROP\b|\bSET\b|\bALTER\b|\bRENAME\b|\bADD\b|\bREMOVE\b|\bCOLUMN\b|\bTO\b|\bAS\b|\bPRIMARY\b|\bKEY\b|\bNOT\b|\bNULL\b|\bUNIQUE\b|\bDEFAULT\b|\bCHECK\b|\bFOREIGN\b|\bREFERENCES\b|\bBEGIN\b|\bCOMMIT\b|\bROLLBACK\b|\bSHOW\b|\bDESCRIBE\b|\bEXPLAIN\b|\bPROFILE\b|\bSTATS\b|\bIF\b|\bEXISTS\b|\bAUTO\b|\bINCREMENT\b|\bAUTOINCREMENT\b|\*|\bTRUE\b|\bFALSE\b|\bNULL\b|'(?:''|[^'])*'|-?\d+\.\d+|-?\d+|[(),=*<>.+/\-]|[A-Za-z_][A-Za-z0-9_]*)",
-    re.IGNORECASE,
-)
+PARSE_CACHE_SIZE = 512
+PARSE_CACHE_MAX_SQL_LENGTH = 4096
+
+_IDENT_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_TWO_CHAR_OPERATORS = frozenset(("=>", "<=", ">=", "!="))
+
+_SPACE, _IDENT, _DIGIT, _QUOTE, _OPERATOR, _PUNCT, _MINUS = range(7)
+_CHAR_KINDS = {
+    **dict.fromkeys(string.whitespace, _SPACE),
+    **dict.fromkeys(string.ascii_letters + "_", _IDENT),
+    **dict.fromkeys(string.digits, _DIGIT),
+    **dict.fromkeys("=<>!", _OPERATOR),
+    **dict.fromkeys("(),*.+/", _PUNCT),
+    "'": _QUOTE,
+    "-": _MINUS,
+}
+
+# Keyword forms resolve to these shared objects, so comparisons against the parser's literals hit
+# the identity fast path of str equality.
+_KEYWORDS = {
+    keyword: keyword
+    for keyword in (
+        "ADD", "ALTER", "AND", "AS", "ASC", "AUTO", "AUTOINCREMENT", "BEGIN", "BETWEEN", "BY",
+        "CASCADE", "CASE", "CHECK", "COLUMN", "COMMIT", "CREATE", "DEFAULT", "DELETE", "DESC",
+        "DESCRIBE", "DISTINCT", "DROP", "END", "EXISTS", "EXPLAIN", "FALSE", "FOREIGN", "FROM",
+        "GROUP", "HAVING", "IF", "IN", "INCREMENT", "INDEX", "INDEXES", "INNER", "INSERT", "INTO",
+        "IS", "JOIN", "KEY", "LEFT", "LIKE", "LIMIT", "NOT", "NULL", "ON", "OR", "ORDER", "PRIMARY",
+        "PROFILE", "REFERENCES", "REINDEX", "REMOVE", "RENAME", "REPLACE", "RESTRICT", "ROLLBACK",
+        "SELECT", "SET", "SHOW", "STATS", "TABLE", "TABLES", "TO", "TRUE", "UNIQUE", "UPDATE",
+        "VALUES", "WHERE",
+    )
+}
+
+_KEYWORD_LITERALS = {"NULL": None, "TRUE": True, "FALSE": False}
+
+_CALL_SPACING_RE = re.compile(r"\b([A-Za-z_][A-Za-z0-9_]*)\s+\(")
 
 
 class ParseError(ValueError):
@@ -43,8 +78,18 @@ class ParseError(ValueError):
 
 
 class TokenStream:
-    def __init__(self, tokens: Sequence[str]):
+    # expect() and consume() take keywords and punctuation already in upper case.
+    __slots__ = ("tokens", "upper", "kinds", "pos")
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        upper: Sequence[str] | None = None,
+        kinds: Sequence[int | None] | None = None,
+    ):
         self.tokens = list(tokens)
+        self.upper = [token.upper() for token in self.tokens] if upper is None else list(upper)
+        self.kinds = [_CHAR_KINDS.get(token[:1]) for token in self.tokens] if kinds is None else list(kinds)
         self.pos = 0
 
     def peek(self) -> str | None:
@@ -52,23 +97,32 @@ class TokenStream:
             return None
         return self.tokens[self.pos]
 
+    def peek_upper(self) -> str | None:
+        if self.pos >= len(self.upper):
+            return None
+        return self.upper[self.pos]
+
     def pop(self) -> str:
-        token = self.peek()
-        if token is None:
+        pos = self.pos
+        if pos >= len(self.tokens):
             raise ParseError("Unexpected end of statement")
-        self.pos += 1
-        return token
+        self.pos = pos + 1
+        return self.tokens[pos]
+
+    def pop_upper(self) -> str:
+        self.pop()
+        return self.upper[self.pos - 1]
 
     def expect(self, expected: str) -> str:
         token = self.pop()
-        if token.upper() != expected.upper():
+        if self.upper[self.pos - 1] != expected:
             raise ParseError(f"Expected '{expected}', got '{token}'")
         return token
 
     def consume(self, expected: str) -> bool:
-        token = self.peek()
-        if token is not None and token.upper() == expected.upper():
-            self.pos += 1
+        pos = self.pos
+        if pos < len(self.upper) and self.upper[pos] == expected:
+            self.pos = pos + 1
             return True
         return False
 
@@ -82,16 +136,16 @@ def _parse_identifier(stream: TokenStream) -> str:
 
 def _parse_select_expression(stream: TokenStream) -> str:
     token = stream.pop()
-    if token.upper() == "CASE":
+    if stream.upper[stream.pos - 1] == "CASE":
         expr_parts = [token]
         case_depth = 1
         while case_depth > 0:
-            part = stream.pop()
-            if part.upper() == "CASE":
+            expr_parts.append(stream.pop())
+            part = stream.upper[stream.pos - 1]
+            if part == "CASE":
                 case_depth += 1
-            elif part.upper() == "END":
+            elif part == "END":
                 case_depth -= 1
-            expr_parts.append(part)
         return " ".join(expr_parts)
 
     if stream.peek() != "(":
@@ -99,6 +153,7 @@ def _parse_select_expression(stream: TokenStream) -> str:
             token = f"{token}.{stream.pop()}"
         return token
 
+    start = stream.pos
     expr_parts = [token, stream.pop()]
     depth = 1
     while depth > 0:
@@ -108,7 +163,7 @@ def _parse_select_expression(stream: TokenStream) -> str:
         elif part == ")":
             depth -= 1
         expr_parts.append(part)
-    if any(part.upper() == "CASE" for part in expr_parts[2:-1]):
+    if "CASE" in stream.upper[start + 1 : stream.pos - 1]:
         return f"{expr_parts[0]}({' '.join(expr_parts[2:-1])})"
     return "".join(expr_parts)
 
@@ -119,7 +174,7 @@ def _tokens_to_sql(tokens: Sequence[str]) -> str:
     sql = sql.replace(" ,", ",")
     sql = sql.replace(" . ", ".")
     sql = sql.replace(" .", ".").replace(". ", ".")
-    sql = re.sub(r"\b([A-Za-z_][A-Za-z0-9_]*)\s+\(", r"\1(", sql)
+    sql = _CALL_SPACING_RE.sub(r"\1(", sql)
     return sql
 
 
@@ -129,8 +184,7 @@ def _parse_optional_table_alias(stream: TokenStream) -> str | None:
     token = stream.peek()
     if token is None:
         return None
-    upper = token.upper()
-    if upper in {
+    if stream.peek_upper() in {
         "JOIN",
         "INNER",
         "LEFT",
@@ -144,7 +198,7 @@ def _parse_optional_table_alias(stream: TokenStream) -> str | None:
         "OR",
     }:
         return None
-    if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", token):
+    if stream.kinds[stream.pos] == _IDENT:
         return stream.pop()
     return None
 
@@ -167,98 +221,190 @@ def _rewrite_select_expr_aliases(expr: str, alias_map: dict[str, str]) -> str:
 
 
 def tokenize(sql: str) -> List[str]:
+    return _scan(sql)[0]
+
+
+def _scan(sql: str) -> Tuple[List[str], List[str], List[int]]:
+    # Returns parallel lists of token text, keyword form (identifiers upper-cased) and token kind.
     cleaned = sql.strip().rstrip(";")
     if not cleaned:
         raise ParseError("Empty SQL statement")
 
     tokens: List[str] = []
+    upper: List[str] = []
+    kinds: List[int] = []
+    length = len(cleaned)
     pos = 0
-    while pos < len(cleaned):
-        if cleaned[pos].isspace():
+    while pos < length:
+        char = cleaned[pos]
+        kind = _CHAR_KINDS.get(char)
+        if kind == _SPACE:
+            pos += 1
+            continue
+        if kind == _PUNCT:
+            tokens.append(char)
+            upper.append(char)
+            kinds.append(_PUNCT)
             pos += 1
             continue
-        match = _TOKEN_RE.match(cleaned, pos)
-        if match is None:
-            snippet = cleaned[pos : pos + 24]
-            line = cleaned.count("\n", 0, pos) + 1
-            line_start = cleaned.rfind("\n", 0, pos) + 1
-            col = pos - line_start + 1
-            raise ParseError(f"Unsupported SQL syntax at line {line}, col {col} near: {snippet!r}")
-        tokens.append(match.group(1))
-        pos = match.end()
+        if kind is None:
+            if char.isspace():
+                pos += 1
+                continue
+            if not char.isdecimal():
+                raise _syntax_error(cleaned, pos)
+            kind = _DIGIT
+
+        end = pos + 1
+        if kind == _IDENT:
+            while end < length and cleaned[end] in _IDENT_CHARS:
+                end += 1
+            word = sys.intern(cleaned[pos:end])
+            tokens.append(word)
+            keyword = word.upper()
+            upper.append(_KEYWORDS.get(keyword, keyword))
+            kinds.append(_IDENT)
+            pos = end
+            continue
+        if kind == _DIGIT:
+            end = _scan_number(cleaned, end)
+        elif kind == _QUOTE:
+            end = _scan_string(cleaned, end)
+            if end < 0:
+                raise _syntax_error(cleaned, pos)
+        elif kind == _OPERATOR:
+            if cleaned[pos : pos + 2] in _TWO_CHAR_OPERATORS:
+                end += 1
+            elif char == "!":
+                raise _syntax_error(cleaned, pos)
+        elif kind == _MINUS:
+            if end < length and cleaned[end].isdecimal():
+                end = _scan_number(cleaned, end)
+                kind = _DIGIT
+            else:
+                kind = _PUNCT
+        token = cleaned[pos:end]
+        tokens.append(token)
+        upper.append(token)
+        kinds.append(kind)
+        pos = end
+
+    return tokens, upper, kinds
+
+
+def _scan_number(sql: str, end: int) -> int:
+    length = len(sql)
+    while end < length and sql[end].isdecimal():
+        end += 1
+    if end + 1 < length and sql[end] == "." and sql[end + 1].isdecimal():
+        end += 2
+        while end < length and sql[end].isdecimal():
+            end += 1
+    return end
+
+
+def _scan_string(sql: str, end: int) -> int:
+    # An unterminated literal ends at its last doubled quote, so "'it''s" scans as "'it'".
+    last_pair = -1
+    while True:
+        end = sql.find("'", end)
+        if end < 0:
+            return last_pair + 1 if last_pair >= 0 else -1
+        if not sql.startswith("'", end + 1):
+            return end + 1
+        last_pair = end
+        end += 2
+
 
-    return tokens
+def _syntax_error(sql: str, pos: int) -> ParseError:
+    snippet = sql[pos : pos + 24]
+    line = sql.count("\n", 0, pos) + 1
+    line_start = sql.rfind("\n", 0, pos) + 1
+    col = pos - line_start + 1
+    return ParseError(f"Unsupported SQL syntax at line {line}, col {col} near: {snippet!r}")
 
 
 def parse(sql: str) -> Statement:
-    stream = TokenStream(tokenize(sql))
-    token = stream.peek()
-    if token is None:
+    # ASTs are frozen and never mutated by the executor, so repeated statements share one.
+    if len(sql) > PARSE_CACHE_MAX_SQL_LENGTH:
+        return _parse_statement(sql)
+    return _parse_cached(sql)
+
+
+def _parse_statement(sql: str) -> Statement:
+    return _parse_stream(TokenStream(*_scan(sql)))
+
+
+def _parse_stream(stream: TokenStream) -> Statement:
+    keyword = stream.peek_upper()
+    if keyword is None:
         raise ParseError("Empty SQL statement")
 
-    keyword = token.upper()
-    if keyword == "CREATE":
-        return _parse_create(stream)
-    if keyword == "INSERT":
-        return _parse_insert(stream)
-    if keyword == "SELECT":
-        return _parse_select(stream)
-    if keyword == "UPDATE":
-        return _parse_update(stream)
-    if keyword == "DELETE":
-        return _parse_delete(stream)
-    if keyword == "DROP":
-        return _parse_drop(stream)
-    if keyword == "ALTER":
-        return _parse_alter(stream)
-    if keyword == "BEGIN":
-        stream.pop()
-        _assert_consumed(stream)
-        return BeginStmt()
-    if keyword == "COMMIT":
-        stream.pop()
+    parse_statement = _STATEMENT_PARSERS.get(keyword)
+    if parse_statement is None:
+        raise ParseError(f"Unsupported command: {keyword}")
+    return parse_statement(stream)
+
+
+def _parse_begin(stream: TokenStream) -> BeginStmt:
+    stream.pop()
+    _assert_consumed(stream)
+    return BeginStmt()
+
+
+def _parse_commit(stream: TokenStream) -> CommitStmt:
+    stream.pop()
+    _assert_consumed(stream)
+    return CommitStmt()
+
+
+def _parse_rollback(stream: TokenStream) -> RollbackStmt:
+    stream.pop()
+    _assert_consumed(stream)
+    return RollbackStmt()
+
+
+def _parse_show(stream: TokenStream) -> ShowTablesStmt | ShowIndexesStmt | ShowStatsStmt:
+    stream.pop()
+    if stream.consume("TABLES"):
         _assert_consumed(stream)
-        return CommitStmt()
-    if keyword == "ROLLBACK":
-        stream.pop()
+        return ShowTablesStmt()
+    if stream.consume("INDEXES"):
+        table_name = stream.pop() if stream.peek() is not None else None
         _assert_consumed(stream)
-        return RollbackStmt()
-    if keyword == "SHOW":
-        stream.pop()
-        if stream.consume("TABLES"):
-            _assert_consumed(stream)
-            return ShowTablesStmt()
-        if stream.consume("INDEXES"):
-            table_name = stream.pop() if stream.peek() is not None else None
-            _assert_consumed(stream)
-            return ShowIndexesStmt(table_name=table_name)
-        if stream.consume("STATS"):
-            _assert_consumed(stream)
-            return ShowStatsStmt()
-        raise ParseError("Expected TABLES, INDEXES, or STATS after SHOW")
-    if keyword == "EXPLAIN":
-        stream.pop()
-        rest = " ".join(stream.tokens[stream.pos :])
-        if not rest.strip():
-            raise ParseError("EXPLAIN requires a statement")
-        return ExplainStmt(statement=parse(rest))
-    if keyword == "PROFILE":
-        stream.pop()
-        rest = " ".join(stream.tokens[stream.pos :])
-        if not rest.strip():
-            raise ParseError("PROFILE requires a statement")
-        return ProfileStmt(statement=parse(rest))
-    if keyword == "DESCRIBE":
-        stream.pop()
-        table_name = stream.pop()
-        _assert_consumed(stream)
-        return DescribeTableStmt(table_name=table_name)
-    if keyword == "REINDEX":
-        stream.pop()
-        table_name = stream.pop()
+        return ShowIndexesStmt(table_name=table_name)
+    if stream.consume("STATS"):
         _assert_consumed(stream)
-        return ReindexStmt(table_name=table_name)
-    raise ParseError(f"Unsupported command: {keyword}")
+        return ShowStatsStmt()
+    raise ParseError("Expected TABLES, INDEXES, or STATS after SHOW")
+
+
+def _parse_explain(stream: TokenStream) -> ExplainStmt:
+    stream.pop()
+    if stream.peek() is None:
+        raise ParseError("EXPLAIN requires a statement")
+    return ExplainStmt(statement=_parse_stream(stream))
+
+
+def _parse_profile(stream: TokenStream) -> ProfileStmt:
+    stream.pop()
+    if stream.peek() is None:
+        raise ParseError("PROFILE requires a statement")
+    return ProfileStmt(statement=_parse_stream(stream))
+
+
+def _parse_describe(stream: TokenStream) -> DescribeTableStmt:
+    stream.pop()
+    table_name = stream.pop()
+    _assert_consumed(stream)
+    return DescribeTableStmt(table_name=table_name)
+
+
+def _parse_reindex(stream: TokenStream) -> ReindexStmt:
+    stream.pop()
+    table_name = stream.pop()
+    _assert_consumed(stream)
+    return ReindexStmt(table_name=table_name)
 
 
 def _parse_create(stream: TokenStream) -> CreateTableStmt | CreateIndexStmt:
@@ -302,7 +448,7 @@ def _parse_create(stream: TokenStream) -> CreateTableStmt | CreateIndexStmt:
             on_delete = "RESTRICT"
             if stream.consume("ON"):
                 stream.expect("DELETE")
-                action = stream.pop().upper()
+                action = stream.pop_upper()
                 if action not in {"CASCADE", "RESTRICT"}:
                     raise ParseError(f"Unsupported ON DELETE action: {action}")
                 on_delete = action
@@ -319,7 +465,7 @@ def _parse_create(stream: TokenStream) -> CreateTableStmt | CreateIndexStmt:
             check_exprs.append(_parse_check_expression(stream))
         else:
             col_name = stream.pop()
-            col_type = stream.pop().upper()
+            col_type = stream.pop_upper()
             primary_key = False
             not_null = False
             unique = False
@@ -347,7 +493,7 @@ def _parse_create(stream: TokenStream) -> CreateTableStmt | CreateIndexStmt:
                     unique = True
                     continue
                 if stream.consume("DEFAULT"):
-                    default_value = _parse_literal(stream.pop())
+                    default_value = _pop_literal(stream)
                     continue
                 if stream.consume("CHECK"):
                     col_check_exprs.append(_parse_check_expression(stream))
@@ -403,23 +549,44 @@ def _parse_insert(stream: TokenStream) -> InsertStmt:
         columns = names
 
     stream.expect("VALUES")
+    values = _parse_values_rows(stream)
+    _assert_consumed(stream)
+    return InsertStmt(table_name=table_name, columns=columns, values=values, or_replace=or_replace)
+
+
+def _parse_values_rows(stream: TokenStream) -> List[List[Any]]:
+    # Bulk VALUES lists walk the token list directly; the stream methods only report errors.
+    tokens = stream.tokens
+    kinds = stream.kinds
+    count = len(tokens)
+    pos = stream.pos
     values: List[List[Any]] = []
     while True:
-        stream.expect("(")
+        if pos >= count or tokens[pos] != "(":
+            stream.pos = pos
+            stream.expect("(")
+        pos += 1
         row_values: List[Any] = []
         while True:
-            row_values.append(_parse_literal(stream.pop()))
-            if stream.consume(","):
+            if pos >= count:
+                stream.pos = pos
+                stream.pop()
+            row_values.append(_token_literal(tokens[pos], kinds[pos]))
+            pos += 1
+            if pos < count and tokens[pos] == ",":
+                pos += 1
                 continue
-            stream.expect(")")
+            if pos >= count or tokens[pos] != ")":
+                stream.pos = pos
+                stream.expect(")")
+            pos += 1
             break
         values.append(row_values)
-        if stream.consume(","):
+        if pos < count and tokens[pos] == ",":
+            pos += 1
             continue
-        break
-
-    _assert_consumed(stream)
-    return InsertStmt(table_name=table_name, columns=columns, values=values, or_replace=or_replace)
+        stream.pos = pos
+        return values
 
 
 def _parse_select(stream: TokenStream) -> SelectStmt:
@@ -498,9 +665,8 @@ def _parse_select(stream: TokenStream) -> SelectStmt:
         stream.expect("BY")
         col = _rewrite_identifier_alias(_parse_identifier(stream), alias_map)
         direction = "ASC"
-        next_tok = stream.peek()
-        if next_tok and next_tok.upper() in {"ASC", "DESC"}:
-            direction = stream.pop().upper()
+        if stream.peek_upper() in {"ASC", "DESC"}:
+            direction = stream.pop_upper()
         order_by = (col, direction)
 
     limit = None
@@ -553,7 +719,7 @@ def _parse_update(stream: TokenStream) -> UpdateStmt:
     while True:
         name = stream.pop()
         stream.expect("=")
-        value = _parse_literal(stream.pop())
+        value = _pop_literal(stream)
         assignments.append((name, value))
         if stream.consume(","):
             continue
@@ -612,7 +778,7 @@ def _parse_alter(
     if stream.consume("ADD"):
         stream.expect("COLUMN")
         col_name = stream.pop()
-        col_type = stream.pop().upper()
+        col_type = stream.pop_upper()
         primary_key = False
         not_null = False
         unique = False
@@ -632,7 +798,7 @@ def _parse_alter(
                 unique = True
                 continue
             if stream.consume("DEFAULT"):
-                default_value = _parse_literal(stream.pop())
+                default_value = _pop_literal(stream)
                 continue
             if stream.consume("CHECK"):
                 col_check_exprs.append(_parse_check_expression(stream))
@@ -673,7 +839,7 @@ def _parse_predicate_groups(stream: TokenStream) -> WhereClause:
     current_group: List[Tuple[str, str, Any]] = []
     while True:
         col = _parse_select_expression(stream)
-        op = stream.pop().upper()
+        op = stream.pop_upper()
 
         if op == "IS":
             if stream.consume("NOT"):
@@ -684,73 +850,32 @@ def _parse_predicate_groups(stream: TokenStream) -> WhereClause:
                 current_group.append((col, "IS NULL", None))
         elif op == "IN":
             stream.expect("(")
-            if stream.peek() is not None and stream.peek().upper() == "SELECT":
-                start = stream.pos
-                depth = 1
-                while depth > 0:
-                    token = stream.pop()
-                    if token == "(":
-                        depth += 1
-                    elif token == ")":
-                        depth -= 1
-                subquery_sql = _tokens_to_sql(stream.tokens[start : stream.pos - 1])
-                current_group.append((col, "IN_SUBQUERY", subquery_sql))
+            if stream.peek_upper() == "SELECT":
+                current_group.append((col, "IN_SUBQUERY", _parse_subquery(stream)))
             else:
-                values: List[Any] = []
-                while True:
-                    values.append(_parse_literal(stream.pop()))
-                    if stream.consume(","):
-                        continue
-                    stream.expect(")")
-                    break
-                current_group.append((col, "IN", values))
+                current_group.append((col, "IN", _parse_literal_list(stream)))
         elif op == "NOT":
             stream.expect("IN")
             stream.expect("(")
-            if stream.peek() is not None and stream.peek().upper() == "SELECT":
-                start = stream.pos
-                depth = 1
-                while depth > 0:
-                    token = stream.pop()
-                    if token == "(":
-                        depth += 1
-                    elif token == ")":
-                        depth -= 1
-                subquery_sql = _tokens_to_sql(stream.tokens[start : stream.pos - 1])
-                current_group.append((col, "NOT IN_SUBQUERY", subquery_sql))
+            if stream.peek_upper() == "SELECT":
+                current_group.append((col, "NOT IN_SUBQUERY", _parse_subquery(stream)))
             else:
-                values = []
-                while True:
-                    values.append(_parse_literal(stream.pop()))
-                    if stream.consume(","):
-                        continue
-                    stream.expect(")")
-                    break
-                current_group.append((col, "NOT IN", values))
+                current_group.append((col, "NOT IN", _parse_literal_list(stream)))
         elif op == "LIKE":
-            value = _parse_literal(stream.pop())
+            value = _pop_literal(stream)
             current_group.append((col, "LIKE", value))
         elif op == "BETWEEN":
-            lower = _parse_literal(stream.pop())
+            lower = _pop_literal(stream)
             stream.expect("AND")
-            upper = _parse_literal(stream.pop())
+            upper = _pop_literal(stream)
             current_group.append((col, "BETWEEN", (lower, upper)))
         else:
             if op not in {"=", "!=", "<", "<=", ">", ">="}:
                 raise ParseError(f"Unsupported operator: {op}")
-            if stream.consume("(") and stream.peek() is not None and stream.peek().upper() == "SELECT":
-                start = stream.pos
-                depth = 1
-                while depth > 0:
-                    token = stream.pop()
-                    if token == "(":
-                        depth += 1
-                    elif token == ")":
-                        depth -= 1
-                subquery_sql = _tokens_to_sql(stream.tokens[start : stream.pos - 1])
-                current_group.append((col, f"{op}_SUBQUERY", subquery_sql))
+            if stream.consume("(") and stream.peek_upper() == "SELECT":
+                current_group.append((col, f"{op}_SUBQUERY", _parse_subquery(stream)))
             else:
-                value = _parse_literal(stream.pop())
+                value = _pop_literal(stream)
                 current_group.append((col, op, value))
 
         if stream.consume("AND"):
@@ -765,20 +890,55 @@ def _parse_predicate_groups(stream: TokenStream) -> WhereClause:
     return WhereClause(groups=groups)
 
 
-def _parse_literal(token: str) -> Any:
-    upper = token.upper()
-    if upper == "NULL":
-        return None
-    if upper == "TRUE":
-        return True
-    if upper == "FALSE":
-        return False
-    if token.startswith("'") and token.endswith("'"):
+def _parse_subquery(stream: TokenStream) -> str:
+    start = stream.pos
+    depth = 1
+    while depth > 0:
+        token = stream.pop()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+    return _tokens_to_sql(stream.tokens[start : stream.pos - 1])
+
+
+def _parse_literal_list(stream: TokenStream) -> List[Any]:
+    values: List[Any] = []
+    while True:
+        values.append(_pop_literal(stream))
+        if stream.consume(","):
+            continue
+        stream.expect(")")
+        return values
+
+
+def _pop_literal(stream: TokenStream) -> Any:
+    token = stream.pop()
+    return _token_literal(token, stream.kinds[stream.pos - 1])
+
+
+def _token_literal(token: str, kind: int | None) -> Any:
+    if kind == _QUOTE:
         return token[1:-1].replace("''", "'")
-    if re.fullmatch(r"-?\d+\.\d+", token):
-        return float(token)
-    if re.fullmatch(r"-?\d+", token):
+    if kind == _DIGIT:
+        return float(token) if "." in token else int(token)
+    return parse_literal(token)
+
+
+def parse_literal(token: str) -> Any:
+    if token.isdecimal():
         return int(token)
+    if token.startswith("'") and token.endswith("'"):
+        return token[1:-1].replace("''", "'")
+    whole, dot, fraction = (token[1:] if token.startswith("-") else token).partition(".")
+    if whole.isdecimal():
+        if not dot:
+            return int(token)
+        if fraction.isdecimal():
+            return float(token)
+    upper = token.upper()
+    if upper in _KEYWORD_LITERALS:
+        return _KEYWORD_LITERALS[upper]
     # Unquoted identifiers as literals are intentionally supported to keep UPDATE concise.
     return token
 
@@ -802,3 +962,26 @@ def _parse_check_expression(stream: TokenStream) -> str:
                 break
         parts.append(token)
     return " ".join(parts)
+
+
+_STATEMENT_PARSERS: Dict[str, Callable[[TokenStream], Statement]] = {
+    "CREATE": _parse_create,
+    "INSERT": _parse_insert,
+    "SELECT": _parse_select,
+    "UPDATE": _parse_update,
+    "DELETE": _parse_delete,
+    "DROP": _parse_drop,
+    "ALTER": _parse_alter,
+    "BEGIN": _parse_begin,
+    "COMMIT": _parse_commit,
+    "ROLLBACK": _parse_rollback,
+    "SHOW": _parse_show,
+    "EXPLAIN": _parse_explain,
+    "PROFILE": _parse_profile,
+    "DESCRIBE": _parse_describe,
+    "REINDEX": _parse_reindex,
+}
+
+_parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(_parse_statement)
+parse.cache_clear = _parse_cached.cache_clear
+parse.cache_info = _parse_cached.cache_info
@@ -20,18 +20,11 @@ def _format_rows_table(rows: list[dict[str, Any]]) -> str:
 
     columns = list(rows[0].keys())
     rendered_rows = [[_format_scalar(row.get(col)) for col in columns] for row in rows]
-
-    widths = []
-    for idx, col in enumerate(columns):
-        cell_width = max(len(r[idx]) for r in rendered_rows) if rendered_rows else 0
-        widths.append(max(len(col), cell_width))
+    widths = [max(map(len, cells)) for cells in zip(columns, *rendered_rows)]
 
     border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
-    header = "| " + " | ".join(col.ljust(widths[i]) for i, col in enumerate(columns)) + " |"
-    body = [
-        "| " + " | ".join(values[i].ljust(widths[i]) for i in range(len(columns))) + " |"
-        for values in rendered_rows
-    ]
+    header = "| " + " | ".join(map(str.ljust, columns, widths)) + " |"
+    body = ["| " + " | ".join(map(str.ljust, values, widths)) + " |" for values in rendered_rows]
 
     return "\n".join([border, header, border, *body, border, f"({len(rows)} row(s))"])
 
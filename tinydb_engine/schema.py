@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import base64
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 SUPPORTED_TYPES = {"INTEGER", "TEXT", "REAL", "BOOLEAN", "TIMESTAMP", "BLOB", "DECIMAL", "NUMERIC"}
@@ -31,22 +32,38 @@ class TableSchema:
     secondary_indexes: List[dict[str, Any]] | None = None
     check_exprs: List[str] | None = None
 
+    _column_positions: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _pk_column: Optional[ColumnSchema] = field(init=False, repr=False, compare=False)
+    _pk_indices: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.refresh_columns()
+
+    def refresh_columns(self) -> None:
+        # Column lookups are cached; call this after any DDL that changes columns in place.
+        self._column_positions = {}
+        for idx, column in enumerate(self.columns):
+            self._column_positions.setdefault(column.name.lower(), idx)
+        self._pk_indices = tuple(idx for idx, column in enumerate(self.columns) if column.primary_key)
+        self._pk_column = self.columns[self._pk_indices[0]] if len(self._pk_indices) == 1 else None
+
     @property
     def pk_column(self) -> Optional[ColumnSchema]:
-        pk_cols = [column for column in self.columns if column.primary_key]
-        if len(pk_cols) == 1:
-            return pk_cols[0]
-        return None
+        return self._pk_column
 
     @property
     def pk_columns(self) -> List[ColumnSchema]:
-        return [column for column in self.columns if column.primary_key]
+        return [self.columns[idx] for idx in self._pk_indices]
+
+    @property
+    def pk_indices(self) -> Tuple[int, ...]:
+        return self._pk_indices
 
     def column_index(self, name: str) -> int:
-        for idx, column in enumerate(self.columns):
-            if column.name.lower() == name.lower():
-                return idx
-        raise KeyError(f"Unknown column '{name}'")
+        try:
+            return self._column_positions[name.lower()]
+        except KeyError:
+            raise KeyError(f"Unknown column '{name}'") from None
 
 
 def normalize_type(type_name: str) -> str:
@@ -55,50 +72,61 @@ def normalize_type(type_name: str) -> str:
         normalized = "DECIMAL"
     if normalized not in SUPPORTED_TYPES:
         raise ValueError(f"Unsupported type: {type_name}")
-    return normalized
+    return sys.intern(normalized)
 
 
 def coerce_value(value: Any, data_type: str) -> Any:
     if value is None:
         return None
-    if data_type == "INTEGER":
-        if isinstance(value, bool):
-            return int(value)
-        return int(value)
-    if data_type == "REAL":
-        return float(value)
-    if data_type == "TEXT":
-        return str(value)
-    if data_type == "TIMESTAMP":
-        return str(value)
-    if data_type == "BLOB":
-        if isinstance(value, bytes):
-            return value
-        if isinstance(value, bytearray):
-            return bytes(value)
-        if isinstance(value, str):
-            if value.startswith("__tinydb_blob_b64__:"):
-                return base64.b64decode(value[len("__tinydb_blob_b64__:") :])
-            return value.encode("utf-8")
-        raise ValueError(f"Cannot coerce '{value}' to BLOB")
-    if data_type == "DECIMAL":
-        if isinstance(value, Decimal):
-            return value
-        if isinstance(value, bool):
-            return Decimal(int(value))
-        return Decimal(str(value))
-    if data_type == "BOOLEAN":
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, (int, float)):
-            return bool(value)
-        text = str(value).strip().lower()
-        if text in {"true", "1"}:
-            return True
-        if text in {"false", "0"}:
-            return False
-        raise ValueError(f"Cannot coerce '{value}' to BOOLEAN")
-    raise ValueError(f"Unsupported type: {data_type}")
+    try:
+        coercer = _COERCERS[data_type]
+    except KeyError:
+        raise ValueError(f"Unsupported type: {data_type}") from None
+    return coercer(value)
+
+
+def _coerce_blob(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if isinstance(value, str):
+        if value.startswith("__tinydb_blob_b64__:"):
+            return base64.b64decode(value[len("__tinydb_blob_b64__:") :])
+        return value.encode("utf-8")
+    raise ValueError(f"Cannot coerce '{value}' to BLOB")
+
+
+def _coerce_decimal(value: Any) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, bool):
+        return Decimal(int(value))
+    return Decimal(str(value))
+
+
+def _coerce_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in {"true", "1"}:
+        return True
+    if text in {"false", "0"}:
+        return False
+    raise ValueError(f"Cannot coerce '{value}' to BOOLEAN")
+
+
+_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "INTEGER": int,
+    "REAL": float,
+    "TEXT": str,
+    "TIMESTAMP": str,
+    "BLOB": _coerce_blob,
+    "DECIMAL": _coerce_decimal,
+    "BOOLEAN": _coerce_boolean,
+}
 
 
 def serialize_schema_map(schema_map: Dict[str, TableSchema]) -> Dict[str, Any]:
@@ -132,11 +160,13 @@ def deserialize_schema_map(payload: Dict[str, Any]) -> Dict[str, TableSchema]:
     output: Dict[str, TableSchema] = {}
     for name, table in payload.items():
         output[name] = TableSchema(
-            name=table["name"],
+            name=sys.intern(table["name"]),
             columns=[
                 ColumnSchema(
                     **{
                         **col,
+                        "name": sys.intern(col["name"]),
+                        "data_type": sys.intern(col["data_type"]),
                         "default_value": _deserialize_schema_value(col.get("default_value")),
                     }
                 )
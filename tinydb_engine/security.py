@@ -4,6 +4,8 @@ import base64
 import hashlib
 import hmac
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
 
 PBKDF2_ALGORITHM = "pbkdf2_sha256"
 DEFAULT_ITERATIONS = 200_000
@@ -41,3 +43,12 @@ def verify_password(password: str, stored_hash: str) -> bool:
 
     computed = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
     return hmac.compare_digest(computed, expected)
+
+
+def verify_passwords(attempts: Iterable[Tuple[str, str]], max_workers: Optional[int] = None) -> List[bool]:
+    # pbkdf2_hmac releases the GIL while hashing, so independent checks run in parallel threads.
+    pairs = list(attempts)
+    if len(pairs) <= 1:
+        return [verify_password(password, stored_hash) for password, stored_hash in pairs]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda pair: verify_password(*pair), pairs))
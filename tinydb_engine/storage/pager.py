@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
 import struct
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from tinydb_engine.wal.wal import WAL
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PAGE_SIZE = 4096
 MAGIC = b"TINYDB01"
+PAGE_CACHE_CAPACITY = 1024
+# Header and metadata overflow pages start with a little-endian u32 payload length.
+_LENGTH_PREFIX = struct.Struct("<I")
+# Positional writes avoid a seek per page; platforms without them (Windows) fall back to seek+write.
+_HAS_POSITIONAL_IO = hasattr(os, "pwrite")
 
 
 class Pager:
@@ -18,18 +30,31 @@ class Pager:
         self.wal = wal
         self._txn_active = False
         self._txn_dirty: Dict[int, bytes] = {}
+        self._header_dirty = False
+        # Committed page images by page id, least recently used first. Uncommitted writes stay
+        # in _txn_dirty, so an entry always matches the data file. The header page is not cached.
+        self._page_cache: OrderedDict[int, bytes] = OrderedDict()
 
         self._recover_if_needed()
         if not os.path.exists(path) or os.path.getsize(path) == 0:
             self._init_file()
 
-        self._fh = open(path, "r+b")
+        self._fh = open(path, "r+b", buffering=0)
+        self._fd = self._fh.fileno()
+        # Pages are read through a read-only map of the file, remapped whenever the file has grown.
+        self._map: Optional[mmap.mmap] = None
+        self._map_size = 0
         self.header = self._read_header()
         self._metadata_cache = self._load_metadata_from_header(self.header)
+        self.metadata_version = 0
+        self._metadata_payload_cache: Optional[tuple[int, bytes]] = None
 
     def close(self) -> None:
-        self._fh.flush()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
         self._fh.close()
+        self.wal.close()
 
     def begin(self) -> None:
         if self._txn_active:
@@ -42,12 +67,16 @@ class Pager:
         if not self._txn_active:
             return
 
-        # Commit marker is written before data pages, so redo can restore committed writes.
-        self.wal.commit()
+        if self._header_dirty:
+            self._persist_header()
+        # Pages stay in memory until commit, so only each page's final image is logged.
+        # The commit marker is written before data pages, so redo can restore them.
         for page_id, page in self._txn_dirty.items():
-            self._write_page_direct(page_id, page)
-        self._fh.flush()
-        os.fsync(self._fh.fileno())
+            self.wal.log_page_write(page_id, page)
+        self.wal.commit()
+        if self._txn_dirty:
+            self._write_pages_direct(self._txn_dirty)
+            os.fsync(self._fd)
         self._txn_dirty.clear()
         self._txn_active = False
 
@@ -55,6 +84,7 @@ class Pager:
         if not self._txn_active:
             return
         self._txn_dirty.clear()
+        self._header_dirty = False
         self.wal.abort()
         self._txn_active = False
 
@@ -65,7 +95,11 @@ class Pager:
     def allocate_page(self) -> int:
         page_id = self.page_count()
         self.header["next_page_id"] = page_id + 1
-        self._persist_header()
+        if self._txn_active:
+            # The header page is written once at commit instead of once per allocation.
+            self._header_dirty = True
+        else:
+            self._persist_header()
         self.write_page(page_id, bytes(self.page_size))
         return page_id
 
@@ -73,10 +107,15 @@ class Pager:
         if self._txn_active and page_id in self._txn_dirty:
             return self._txn_dirty[page_id]
 
-        self._fh.seek(page_id * self.page_size)
-        data = self._fh.read(self.page_size)
+        cache = self._page_cache
+        data = cache.get(page_id)
+        if data is not None:
+            cache.move_to_end(page_id)
+            return data
+        data = self._read_at(page_id * self.page_size, self.page_size)
         if len(data) != self.page_size:
             raise ValueError(f"Invalid page read {page_id}")
+        self._cache_page(page_id, data)
         return data
 
     def write_page(self, page_id: int, data: bytes) -> None:
@@ -85,7 +124,6 @@ class Pager:
 
         if self._txn_active:
             self._txn_dirty[page_id] = data
-            self.wal.log_page_write(page_id, data)
             return
 
         self._write_page_direct(page_id, data)
@@ -95,6 +133,7 @@ class Pager:
 
     def set_metadata(self, metadata: Dict[str, Any]) -> None:
         self._metadata_cache = dict(metadata)
+        self.metadata_version += 1
         self._persist_header()
 
     def _init_file(self) -> None:
@@ -117,11 +156,16 @@ class Pager:
         if not os.path.exists(self.path):
             self._init_file()
 
+        # Later committed transactions overwrite earlier ones, so only each page's last image is applied.
+        latest: Dict[int, bytes] = {}
+        for _txn_id, writes in replay.items():
+            for write in writes:
+                latest[write.page_id] = write.after_image
+
         with open(self.path, "r+b") as handle:
-            for _txn_id, writes in replay.items():
-                for write in writes:
-                    handle.seek(write.page_id * self.page_size)
-                    handle.write(write.after_image)
+            for page_id, data in _page_runs(latest):
+                handle.seek(page_id * self.page_size)
+                handle.write(data)
             handle.flush()
             os.fsync(handle.fileno())
 
@@ -129,7 +173,7 @@ class Pager:
 
     def _read_header(self) -> Dict[str, Any]:
         page = self.read_page(0)
-        (size,) = struct.unpack("<I", page[:4])
+        (size,) = _LENGTH_PREFIX.unpack_from(page)
         payload = page[4 : 4 + size]
         header = json.loads(payload.decode("utf-8"))
         if header.get("magic") != MAGIC.decode("ascii"):
@@ -139,20 +183,22 @@ class Pager:
         return header
 
     def _persist_header(self) -> None:
+        self._header_dirty = False
         header_for_disk = dict(self.header)
-        metadata_payload = json.dumps(self._metadata_cache, separators=(",", ":")).encode("utf-8")
+        metadata_payload = self._metadata_payload()
 
         # Fast path: keep metadata inline when it fits.
         header_for_disk["metadata"] = self._metadata_cache
         header_for_disk.pop("metadata_overflow_pages", None)
         header_for_disk.pop("metadata_overflow_size", None)
-        try:
-            page = self._encode_header_page(header_for_disk)
-            self.header = header_for_disk
-            self.write_page(0, page)
-            return
-        except ValueError:
-            pass
+        if len(metadata_payload) + 4 < self.page_size:
+            try:
+                page = self._encode_header_page(header_for_disk, metadata_payload)
+                self.header = header_for_disk
+                self.write_page(0, page)
+                return
+            except ValueError:
+                pass
 
         # Spill metadata to overflow pages and store only pointers in header.
         chunk_size = self.page_size - 4
@@ -166,10 +212,11 @@ class Pager:
         for i, page_id in enumerate(overflow_pages):
             chunk = metadata_payload[i * chunk_size : (i + 1) * chunk_size]
             out = bytearray(self.page_size)
-            out[:4] = struct.pack("<I", len(chunk))
+            _LENGTH_PREFIX.pack_into(out, 0, len(chunk))
             out[4 : 4 + len(chunk)] = chunk
             self.write_page(page_id, bytes(out))
 
+        header_for_disk["next_page_id"] = self.header["next_page_id"]
         header_for_disk["metadata"] = {}
         header_for_disk["metadata_overflow_pages"] = overflow_pages
         header_for_disk["metadata_overflow_size"] = len(metadata_payload)
@@ -193,7 +240,7 @@ class Pager:
         raw = bytearray()
         for page_id in overflow_pages:
             page = self.read_page(int(page_id))
-            (chunk_len,) = struct.unpack("<I", page[:4])
+            (chunk_len,) = _LENGTH_PREFIX.unpack_from(page)
             if chunk_len < 0 or chunk_len > self.page_size - 4:
                 raise ValueError("Corrupt metadata overflow page")
             raw.extend(page[4 : 4 + chunk_len])
@@ -207,15 +254,96 @@ class Pager:
             raise ValueError("Corrupt metadata payload")
         return loaded
 
-    def _encode_header_page(self, header: Dict[str, Any]) -> bytes:
-        payload = json.dumps(header, separators=(",", ":")).encode("utf-8")
-        if len(payload) + 4 > self.page_size:
+    def _metadata_payload(self) -> bytes:
+        # Metadata only changes through set_metadata, so its JSON is reused until the version moves.
+        cached = self._metadata_payload_cache
+        if cached is not None and cached[0] == self.metadata_version:
+            return cached[1]
+        payload = _json_bytes(self._metadata_cache)
+        self._metadata_payload_cache = (self.metadata_version, payload)
+        return payload
+
+    def _encode_header_page(self, header: Dict[str, Any], metadata_payload: Optional[bytes] = None) -> bytes:
+        if metadata_payload is None:
+            payload = _json_bytes(header)
+        else:
+            # Splice the already-encoded metadata in rather than serializing it a second time.
+            rest = {key: value for key, value in header.items() if key != "metadata"}
+            encoded = _json_bytes(rest)
+            payload = encoded[:-1] + b',"metadata":' + metadata_payload + b"}"
+        padding = self.page_size - _LENGTH_PREFIX.size - len(payload)
+        if padding < 0:
             raise ValueError("Header too large")
-        out = bytearray(self.page_size)
-        out[:4] = struct.pack("<I", len(payload))
-        out[4 : 4 + len(payload)] = payload
-        return bytes(out)
+        return b"".join((_LENGTH_PREFIX.pack(len(payload)), payload, bytes(padding)))
 
     def _write_page_direct(self, page_id: int, data: bytes) -> None:
-        self._fh.seek(page_id * self.page_size)
-        self._fh.write(data)
+        self._write_at(page_id * self.page_size, data)
+        self._cache_page(page_id, data if type(data) is bytes else bytes(data))
+
+    def _write_pages_direct(self, pages: Dict[int, bytes]) -> None:
+        for page_id, data in _page_runs(pages):
+            self._write_at(page_id * self.page_size, data)
+        for page_id, data in pages.items():
+            self._cache_page(page_id, data)
+
+    def _cache_page(self, page_id: int, data: bytes) -> None:
+        if page_id == 0:
+            return
+        cache = self._page_cache
+        cache[page_id] = data
+        cache.move_to_end(page_id)
+        if len(cache) > PAGE_CACHE_CAPACITY:
+            cache.popitem(last=False)
+
+    def _read_at(self, offset: int, size: int) -> bytes:
+        end = offset + size
+        if end > self._map_size:
+            self._remap()
+        if self._map is None:
+            return b""
+        return self._map[offset:end]
+
+    def _remap(self) -> None:
+        file_size = os.fstat(self._fd).st_size
+        if file_size == self._map_size:
+            return
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._map_size = 0
+        if file_size:
+            self._map = mmap.mmap(self._fd, file_size, access=mmap.ACCESS_READ)
+            self._map_size = file_size
+
+    def _write_at(self, offset: int, data: bytes) -> None:
+        if not _HAS_POSITIONAL_IO:
+            self._fh.seek(offset)
+            self._fh.write(data)
+            return
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(self._fd, view, offset)
+            view = view[written:]
+            offset += written
+
+
+def _page_runs(pages: Dict[int, bytes]) -> Iterator[Tuple[int, bytes]]:
+    # Sorted so runs of adjacent page ids go out as one contiguous write.
+    page_ids = sorted(pages)
+    run_start = 0
+    for i in range(1, len(page_ids) + 1):
+        if i == len(page_ids) or page_ids[i] != page_ids[i - 1] + 1:
+            run = page_ids[run_start:i]
+            data = pages[run[0]] if len(run) == 1 else b"".join(pages[page_id] for page_id in run)
+            yield run[0], data
+            run_start = i
+
+
+def _json_bytes(value: Any) -> bytes:
+    # Headers are still read with json: orjson would load integers wider than 64 bits as floats.
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
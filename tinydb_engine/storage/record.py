@@ -4,27 +4,146 @@ import base64
 import json
 import struct
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, List
 
+# Binary rows: <I payload size>, format byte, <H column count>, one type tag per column, the
+# fixed-width fields of every non-NULL column packed by a struct derived from the tags, and
+# finally the variable-length bytes (text, blobs, decimals, big ints) in column order.
+# Rows written before this format are a size prefix followed by a JSON array.
+ROW_FORMAT_BINARY = 1
+
+_TAG_NULL = 0
+_TAG_INT = 1
+_TAG_INT32 = 2
+_TAG_REAL = 3
+_TAG_TEXT = 4
+_TAG_BOOL = 5
+_TAG_BLOB = 6
+_TAG_DECIMAL = 7
+_TAG_BIGINT = 8
+_FIELD_CODES = {
+    _TAG_NULL: "",
+    _TAG_INT: "q",
+    _TAG_INT32: "i",
+    _TAG_REAL: "d",
+    _TAG_TEXT: "I",
+    _TAG_BOOL: "?",
+    _TAG_BLOB: "I",
+    _TAG_DECIMAL: "I",
+    _TAG_BIGINT: "I",
+}
+_ROW_HEADER = struct.Struct("<IBH")
+_SIZE = struct.Struct("<I")
+_JSON_ARRAY_START = ord("[")
+_INT32_MIN = -(1 << 31)
+_INT32_MAX = (1 << 31) - 1
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
 
 def encode_row(values: List[Any]) -> bytes:
-    # JSON keeps the MVP row codec easy to reason about while still producing binary payloads.
-    payload = json.dumps(values, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode("utf-8")
-    return struct.pack("<I", len(payload)) + payload
+    tags = bytearray()
+    fields: List[Any] = []
+    tail: List[bytes] = []
+    for value in values:
+        if value is None:
+            tags.append(_TAG_NULL)
+        elif isinstance(value, str):
+            data = value.encode("utf-8")
+            tags.append(_TAG_TEXT)
+            fields.append(len(data))
+            tail.append(data)
+        elif isinstance(value, bool):
+            tags.append(_TAG_BOOL)
+            fields.append(value)
+        elif isinstance(value, int):
+            if _INT32_MIN <= value <= _INT32_MAX:
+                tags.append(_TAG_INT32)
+                fields.append(value)
+            elif _INT64_MIN <= value <= _INT64_MAX:
+                tags.append(_TAG_INT)
+                fields.append(value)
+            else:
+                data = str(value).encode("ascii")
+                tags.append(_TAG_BIGINT)
+                fields.append(len(data))
+                tail.append(data)
+        elif isinstance(value, float):
+            tags.append(_TAG_REAL)
+            fields.append(value)
+        elif isinstance(value, (bytes, bytearray)):
+            data = bytes(value)
+            tags.append(_TAG_BLOB)
+            fields.append(len(data))
+            tail.append(data)
+        elif isinstance(value, Decimal):
+            data = str(value).encode("ascii")
+            tags.append(_TAG_DECIMAL)
+            fields.append(len(data))
+            tail.append(data)
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} cannot be stored in a row")
+
+    tag_bytes = bytes(tags)
+    body = _field_struct(tag_bytes).pack(*fields)
+    size = _ROW_HEADER.size - _SIZE.size + len(tag_bytes) + len(body) + sum(map(len, tail))
+    return b"".join((_ROW_HEADER.pack(size, ROW_FORMAT_BINARY, len(tag_bytes)), tag_bytes, body, *tail))
 
 
 def decode_row(blob: bytes) -> List[Any]:
-    (size,) = struct.unpack("<I", blob[:4])
-    payload = blob[4 : 4 + size]
-    return json.loads(payload.decode("utf-8"), object_hook=_json_object_hook)
+    if len(blob) > _SIZE.size and blob[_SIZE.size] == _JSON_ARRAY_START:
+        return _decode_json_row(blob)
+    _size, row_format, count = _ROW_HEADER.unpack_from(blob)
+    if row_format != ROW_FORMAT_BINARY:
+        raise ValueError(f"Unknown row format: {row_format}")
+    offset = _ROW_HEADER.size
+    tags = bytes(blob[offset : offset + count])
+    if len(tags) != count:
+        raise ValueError("Truncated row header")
+    layout = _field_struct(tags)
+    fields = layout.unpack_from(blob, offset + count)
+    offset += count + layout.size
 
+    values: List[Any] = []
+    field_index = 0
+    for tag in tags:
+        if tag == _TAG_NULL:
+            values.append(None)
+            continue
+        field = fields[field_index]
+        field_index += 1
+        if tag == _TAG_TEXT:
+            values.append(blob[offset : offset + field].decode("utf-8"))
+            offset += field
+        elif tag <= _TAG_REAL or tag == _TAG_BOOL:
+            values.append(field)
+        else:
+            data = bytes(blob[offset : offset + field])
+            offset += field
+            if tag == _TAG_BLOB:
+                values.append(data)
+            elif tag == _TAG_DECIMAL:
+                values.append(Decimal(data.decode("ascii")))
+            else:
+                values.append(int(data.decode("ascii")))
+    if offset > len(blob):
+        raise ValueError("Truncated row payload")
+    return values
 
-def _json_default(value: Any) -> Any:
-    if isinstance(value, Decimal):
-        return {"__type__": "decimal", "value": str(value)}
-    if isinstance(value, (bytes, bytearray)):
-        return {"__type__": "bytes", "value": base64.b64encode(bytes(value)).decode("ascii")}
-    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+@lru_cache(maxsize=256)
+def _field_struct(tags: bytes) -> struct.Struct:
+    try:
+        return struct.Struct("<" + "".join(_FIELD_CODES[tag] for tag in tags))
+    except KeyError as exc:
+        raise ValueError(f"Unknown row value tag: {exc.args[0]}") from None
+
+
+def _decode_json_row(blob: bytes) -> List[Any]:
+    (size,) = _SIZE.unpack_from(blob)
+    payload = blob[_SIZE.size : _SIZE.size + size]
+    return json.loads(payload.decode("utf-8"), object_hook=_json_object_hook)
 
 
 def _json_object_hook(value: dict[str, Any]) -> Any:
@@ -3,8 +3,21 @@ from __future__ import annotations
 import base64
 import json
 import os
+import struct
+import zlib
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import BinaryIO, Dict, Iterator, List
+
+# Each record is a <type, txn id, page id, payload size> frame, the payload (a page image for
+# PAGE_WRITE) and a CRC32 of both. Logs written before this format hold one JSON object per
+# line; those lines start with "{" and are still read during recovery.
+RECORD_BEGIN = 0
+RECORD_PAGE_WRITE = 1
+RECORD_COMMIT = 2
+
+_RECORD_HEADER = struct.Struct("<BIQI")
+_RECORD_CRC = struct.Struct("<I")
+_JSON_RECORD_START = ord("{")
 
 
 @dataclass
@@ -18,6 +31,10 @@ class WAL:
         self.path = f"{db_path}.wal"
         self._active_txn_id: int | None = None
         self._next_txn_id = 1
+        self._fh: BinaryIO | None = None
+        # Records of the active transaction are buffered and hit the disk with one fsync at commit.
+        self._pending = bytearray()
+        self._pending_writes = 0
 
     def begin(self) -> int:
         if self._active_txn_id is not None:
@@ -25,64 +42,116 @@ class WAL:
         txn_id = self._next_txn_id
         self._next_txn_id += 1
         self._active_txn_id = txn_id
-        self._append({"type": "BEGIN", "txn_id": txn_id})
+        self._pending.clear()
+        self._pending_writes = 0
+        self._append(RECORD_BEGIN, txn_id)
         return txn_id
 
     def log_page_write(self, page_id: int, after_image: bytes) -> None:
         if self._active_txn_id is None:
             raise RuntimeError("No active transaction")
-        encoded = base64.b64encode(after_image).decode("ascii")
-        self._append(
-            {
-                "type": "PAGE_WRITE",
-                "txn_id": self._active_txn_id,
-                "page_id": page_id,
-                "after_image": encoded,
-            }
-        )
+        self._append(RECORD_PAGE_WRITE, self._active_txn_id, page_id, after_image)
+        self._pending_writes += 1
 
     def commit(self) -> None:
         if self._active_txn_id is None:
             return
-        self._append({"type": "COMMIT", "txn_id": self._active_txn_id})
+        # A transaction without page writes has nothing to redo, so it never reaches the log.
+        if self._pending_writes:
+            self._append(RECORD_COMMIT, self._active_txn_id)
+            handle = self._handle()
+            handle.write(self._pending)
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._pending.clear()
+        self._pending_writes = 0
         self._active_txn_id = None
 
     def abort(self) -> None:
-        # No ABORT record is required for redo-only recovery; clearing active state is enough.
+        # No ABORT record is required for redo-only recovery; dropping the buffered records is enough.
+        self._pending.clear()
+        self._pending_writes = 0
         self._active_txn_id = None
 
     def reset(self) -> None:
+        self.close()
         open(self.path, "wb").close()
 
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
     def recover(self) -> Dict[int, List[PageWrite]]:
         if not os.path.exists(self.path):
             return {}
 
         txns: Dict[int, List[PageWrite]] = {}
         committed: set[int] = set()
-        with open(self.path, "r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                entry = json.loads(line)
-                txn_id = int(entry["txn_id"])
-                if entry["type"] == "BEGIN":
+        with open(self.path, "rb") as handle:
+            for record_type, txn_id, page_id, after in self._read_records(handle):
+                if record_type == RECORD_BEGIN:
                     txns.setdefault(txn_id, [])
-                elif entry["type"] == "PAGE_WRITE":
-                    after = base64.b64decode(entry["after_image"])
-                    txns.setdefault(txn_id, []).append(
-                        PageWrite(page_id=int(entry["page_id"]), after_image=after)
-                    )
-                elif entry["type"] == "COMMIT":
+                elif record_type == RECORD_PAGE_WRITE:
+                    txns.setdefault(txn_id, []).append(PageWrite(page_id=page_id, after_image=after))
+                elif record_type == RECORD_COMMIT:
                     committed.add(txn_id)
 
         replay = {tid: txns.get(tid, []) for tid in sorted(committed)}
         self._next_txn_id = (max(txns.keys()) + 1) if txns else 1
         return replay
 
-    def _append(self, entry: dict) -> None:
-        with open(self.path, "a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, separators=(",", ":")) + "\n")
-            handle.flush()
-            os.fsync(handle.fileno())
+    def _append(self, record_type: int, txn_id: int, page_id: int = 0, payload: bytes = b"") -> None:
+        header = _RECORD_HEADER.pack(record_type, txn_id, page_id, len(payload))
+        self._pending += header
+        self._pending += payload
+        self._pending += _RECORD_CRC.pack(zlib.crc32(payload, zlib.crc32(header)))
+
+    def _handle(self) -> BinaryIO:
+        if self._fh is None:
+            self._fh = open(self.path, "ab")
+        return self._fh
+
+    def _read_records(self, handle: BinaryIO) -> Iterator[tuple[int, int, int, bytes]]:
+        # Frames are read one at a time rather than loading the whole log into memory first.
+        remaining = os.fstat(handle.fileno()).st_size
+        while remaining > 0:
+            first = handle.read(1)
+            if not first:
+                return
+            remaining -= 1
+            if first[0] == _JSON_RECORD_START:
+                line = first + handle.readline()
+                remaining -= len(line) - 1
+                yield self._decode_json_record(line.rstrip(b"\r\n"))
+                continue
+            if first in (b"\r", b"\n"):
+                continue
+            # A torn frame can only be the last append; nothing after it was acknowledged.
+            header = first + handle.read(_RECORD_HEADER.size - 1)
+            if len(header) != _RECORD_HEADER.size:
+                return
+            record_type, txn_id, page_id, size = _RECORD_HEADER.unpack(header)
+            remaining -= _RECORD_HEADER.size - 1
+            if size + _RECORD_CRC.size > remaining:
+                return
+            payload = handle.read(size)
+            crc = handle.read(_RECORD_CRC.size)
+            remaining -= size + _RECORD_CRC.size
+            if len(payload) != size or len(crc) != _RECORD_CRC.size:
+                return
+            if _RECORD_CRC.unpack(crc)[0] != zlib.crc32(payload, zlib.crc32(header)):
+                return
+            yield record_type, txn_id, page_id, payload
+
+    @staticmethod
+    def _decode_json_record(line: bytes) -> tuple[int, int, int, bytes]:
+        entry = json.loads(line.decode("utf-8"))
+        txn_id = int(entry["txn_id"])
+        if entry["type"] == "BEGIN":
+            return RECORD_BEGIN, txn_id, 0, b""
+        if entry["type"] == "PAGE_WRITE":
+            return RECORD_PAGE_WRITE, txn_id, int(entry["page_id"]), base64.b64decode(entry["after_image"])
+        if entry["type"] == "COMMIT":
+            return RECORD_COMMIT, txn_id, 0, b""
+        return -1, txn_id, 0, b""